@@ -37,9 +37,10 @@ Example:
 
 import logging
 import sqlite3
+import threading
 from contextlib import contextmanager
 from pathlib import Path
-from typing import Dict, Iterator, Optional
+from typing import Any, Dict, Iterable, Iterator, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -53,11 +54,15 @@ class Database:
     and includes automatic schema initialization.
 
     Attributes:
-        db_path: Path to the SQLite database file.
+        db_path: Path to the SQLite database file, or None when the
+            database was opened from a "file:" URI.
 
     Thread Safety:
-        SQLite connections are not thread-safe. Create a new Database
-        instance per thread if concurrent access is needed.
+        Every operation opens its own connection, and operations on one
+        instance are serialized by a lock, so a Database may be shared by
+        threads (PageProcessor's upload workers record through one). This
+        also keeps a shared-cache in-memory database from raising "database
+        table is locked" when two threads write at once.
 
     Example:
         >>> db = Database("./data/bot.db")
@@ -84,21 +89,27 @@ class Database:
 
         Args:
             db_path: Path to the SQLite database file. Can be relative or absolute.
-                Parent directories will be created if they don't exist.
+                Parent directories will be created if they don't exist. A SQLite
+                URI (starting with "file:") is opened as a URI instead, e.g.
+                "file:nc?mode=memory&cache=shared" for a shared in-memory database.
 
         Example:
             >>> db = Database("./data/nc_files.db")
             >>> # Database file created at ./data/nc_files.db
         """
-        self.db_path: Path = Path(db_path)
+        self._uri: Optional[str] = db_path if db_path.startswith("file:") else None
+        self.db_path: Optional[Path] = None if self._uri is not None else Path(db_path)
+        # Serializes _get_connection() across threads sharing this instance
+        self._lock: threading.Lock = threading.Lock()
 
         # Create parent directory if it doesn't exist
-        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        if self.db_path is not None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
 
         # Initialize database schema
         self._init_schema()
 
-        logger.info(f"Database initialized at {self.db_path}")
+        logger.info(f"Database initialized at {self._uri or self.db_path}")
 
     @contextmanager
     def _get_connection(self) -> Iterator[sqlite3.Connection]:
@@ -107,6 +118,7 @@ class Database:
 
         Creates a new database connection, yields it for operations, and handles
         commit/rollback automatically based on whether an exception occurred.
+        The instance lock is held until the connection is closed.
 
         Yields:
             sqlite3.Connection: A database connection configured with Row factory.
@@ -119,18 +131,22 @@ class Database:
             ...     conn.execute("SELECT * FROM uploads")
             ...     # Auto-commits on success, rollback on exception
         """
-        conn = sqlite3.connect(str(self.db_path))
-        conn.row_factory = sqlite3.Row  # Access columns by name
-
-        try:
-            yield conn
-            conn.commit()
-        except Exception:
-            conn.rollback()
-            logger.exception(f"Database error")
-            raise
-        finally:
-            conn.close()
+        with self._lock:
+            if self._uri is not None:
+                conn = sqlite3.connect(self._uri, uri=True)
+            else:
+                conn = sqlite3.connect(str(self.db_path))
+            conn.row_factory = sqlite3.Row  # Access columns by name
+
+            try:
+                yield conn
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                logger.exception(f"Database error")
+                raise
+            finally:
+                conn.close()
 
     def _init_schema(self) -> None:
         """
@@ -213,6 +229,34 @@ class Database:
 
         logger.debug(f"Recorded upload: {filename} ({language}) - {status}")
 
+    def record_uploads_bulk(self, rows: Iterable[Tuple[str, str, str, Optional[str]]]) -> None:
+        """
+        Record several file upload attempts in a single transaction.
+
+        Equivalent to calling record_upload() once per row, but all rows are
+        inserted with one executemany() call and committed together.
+
+        Args:
+            rows: Iterable of (filename, language, status, error) tuples.
+                See record_upload() for the meaning of each field.
+
+        Example:
+            >>> db.record_uploads_bulk([
+            ...     ("a.jpg", "en", "success", None),
+            ...     ("b.jpg", "en", "failed", "Network timeout"),
+            ... ])
+        """
+        with self._get_connection() as conn:
+            cursor = conn.executemany(
+                """
+                INSERT INTO uploads (filename, language, status, error, uploaded_at)
+                VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP)
+                """,
+                rows,
+            )
+
+        logger.debug(f"Recorded {cursor.rowcount} uploads")
+
     def record_page_processing(
         self,
         page_title: str,
@@ -283,6 +327,50 @@ class Database:
 
             return result["count"] > 0 if result else False
 
+    def get_upload(self, filename: str, language: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """
+        Get the most recent upload record for a file.
+
+        Lookups go through the idx_uploads_filename_lang index.
+
+        Args:
+            filename: Name of the file to look up.
+            language: Optional Wikipedia language code. If None, records
+                for every language are considered.
+
+        Returns:
+            Dictionary with the record's columns (id, filename, language,
+            uploaded_at, status, error), or None if the file was never recorded.
+
+        Example:
+            >>> db.record_upload("image.jpg", "en", "failed", "Network error")
+            >>> db.get_upload("image.jpg", "en")["status"]
+            'failed'
+            >>> db.get_upload("other.jpg") is None
+            True
+        """
+        with self._get_connection() as conn:
+            if language:
+                row = conn.execute(
+                    """
+                    SELECT * FROM uploads
+                    WHERE filename = ? AND language = ?
+                    ORDER BY id DESC LIMIT 1
+                    """,
+                    (filename, language),
+                ).fetchone()
+            else:
+                row = conn.execute(
+                    """
+                    SELECT * FROM uploads
+                    WHERE filename = ?
+                    ORDER BY id DESC LIMIT 1
+                    """,
+                    (filename,),
+                ).fetchone()
+
+        return dict(row) if row else None
+
     def get_statistics(self, language: Optional[str] = None) -> Dict[str, int]:
         """
         Get upload and processing statistics.
@@ -26,22 +26,26 @@ Example:
 
 import logging
 import re
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from typing import List
 
 import wikitextparser as wtp
 
 logger = logging.getLogger(__name__)
 
+# Matches [[Category:...]] links (optionally with a sort key), across lines
+_CATEGORY_RE = re.compile(r"\[\[Category:.*?\]\]", re.IGNORECASE | re.DOTALL)
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class NCTemplate:
     """
     Represents a {{NC}} template found in a Wikipedia page.
 
     The NC (NC Commons) template is used to mark files that should be imported
     from NC Commons to Wikipedia. This dataclass captures the template's
-    components for processing and conversion.
+    components for processing and conversion. Instances are immutable and use
+    __slots__, as many are created per page.
 
     Template Format:
         {{NC|filename.jpg|optional caption}}
@@ -129,6 +133,11 @@ def parse_language_list(page_text: str) -> List[str]:
     """
     logger.info("Parsing language list")
 
+    # Cheap rejection: no template invocations means nothing to parse
+    if "{{" not in page_text:
+        logger.info("Parsed 0 languages: []")
+        return []
+
     parsed = wtp.parse(page_text)
     languages: List[str] = []
 
@@ -187,7 +196,33 @@ def extract_nc_templates(page_text: str) -> List[NCTemplate]:
     """
     logger.debug("Extracting NC templates")
 
-    parsed = wtp.parse(page_text)
+    # Cheap rejection: most pages contain no template invocations at all
+    if "{{" not in page_text:
+        logger.info("Extracted 0 NC templates")
+        return []
+
+    return extract_nc_templates_from_parsed(wtp.parse(page_text))
+
+
+def extract_nc_templates_from_parsed(parsed: wtp.WikiText) -> List[NCTemplate]:
+    """
+    Extract all {{NC}} templates from already-parsed wikitext.
+
+    Same as extract_nc_templates(), but takes a wikitextparser.WikiText so
+    callers that already hold a parse tree of the page do not parse it again.
+
+    Args:
+        parsed: Result of wikitextparser.parse() for a Wikipedia page.
+
+    Returns:
+        List of NCTemplate objects, one for each NC template found.
+        Templates with empty filenames are skipped.
+
+    Example:
+        >>> parsed = wtp.parse("{{NC|Photo1.jpg|First}}")
+        >>> extract_nc_templates_from_parsed(parsed)[0].filename
+        'Photo1.jpg'
+    """
     templates: List[NCTemplate] = []
 
     for template in parsed.templates:
@@ -245,6 +280,10 @@ def remove_categories(text: str) -> str:
         - Matching is case-insensitive to catch [[category:]], [[Category:]], etc.
         - The function handles both [[Category:Name]] and [[Category:Name|SortKey]] formats
     """
+    # Cheap rejection: no wiki links means no category tags
+    if "[[" not in text:
+        return text.strip()
+
     # Remove category tags (case-insensitive)
-    cleaned = re.sub(r"\[\[Category:.*?\]\]", "", text, flags=re.IGNORECASE | re.DOTALL)
+    cleaned = _CATEGORY_RE.sub("", text)
     return cleaned.strip()
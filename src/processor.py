@@ -8,11 +8,11 @@ PageProcessor class orchestrates the complete workflow for each page.
 Processing Workflow:
     1. Fetch page content from Wikipedia
     2. Extract all {{NC|filename|caption}} templates
-    3. For each template:
+    3. For each unique file referenced by the templates (optionally concurrently):
        a. Check if file already exists on Wikipedia
        b. If not, upload from NC Commons
        c. Handle duplicates and errors
-    4. Replace NC templates with [[File:...]] syntax
+    4. Replace every NC template with [[File:...]] syntax
     5. Add tracking category to page
     6. Save updated page to Wikipedia
     7. Record processing in database
@@ -26,15 +26,26 @@ Example:
 """
 
 import logging
-from typing import Dict, List
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
+from typing import TYPE_CHECKING, Any, Callable, Dict, List
 
-from .database import Database
 from .parsers import NCTemplate, extract_nc_templates
-from .uploader import FileUploader
-from .wiki_api import WikipediaAPI
+
+# Only needed for annotations; importing them at runtime would pull in mwclient
+# and the uploader stack for every importer of this module.
+if TYPE_CHECKING:
+    from .database import Database
+    from .uploader import FileUploader
+    from .wiki_api import WikipediaAPI
 
 logger = logging.getLogger(__name__)
 
+# Number of files uploaded concurrently when config has no processing.upload_workers.
+# Workers share one WikipediaAPI and its mwclient session, whose requests.Session and
+# token cache are not documented as thread-safe, so concurrency is opt-in.
+DEFAULT_UPLOAD_WORKERS: int = 1
+
 
 class PageProcessor:
     """
@@ -58,9 +69,9 @@ class PageProcessor:
 
     def __init__(
         self,
-        wiki_api: WikipediaAPI,
-        uploader: FileUploader,
-        database: Database,
+        wiki_api: "WikipediaAPI",
+        uploader: "FileUploader",
+        database: "Database",
         config: dict,
     ) -> None:
         """
@@ -73,10 +84,15 @@ class PageProcessor:
             config: Configuration with 'wikipedia' settings for
                 pagecategory and other options.
         """
-        self.wiki_api: WikipediaAPI = wiki_api
-        self.uploader: FileUploader = uploader
-        self.db: Database = database
+        self.wiki_api: "WikipediaAPI" = wiki_api
+        self.uploader: "FileUploader" = uploader
+        self.db: "Database" = database
         self.config: dict = config
+        # An empty upload_workers (or processing) key in the YAML config loads as None
+        processing: dict = config.get("processing") or {}
+        self.upload_workers: int = max(1, int(processing.get("upload_workers") or DEFAULT_UPLOAD_WORKERS))
+        # Tracking category link added to every updated page, built once per processor
+        self._category_link: str = f"[[{config['wikipedia']['pagecategory']}]]"
 
     def process_page(self, page_title: str) -> bool:
         """
@@ -85,7 +101,7 @@ class PageProcessor:
         Executes the complete import workflow for a page:
         1. Fetches page content
         2. Extracts NC templates
-        3. Uploads/processes each file
+        3. Uploads/processes each unique file once
         4. Replaces templates with file syntax
         5. Saves updated page
 
@@ -104,7 +120,10 @@ class PageProcessor:
 
         Note:
             Even if the page fetch fails, the attempt is recorded in
-            the database for tracking purposes.
+            the database for tracking purposes. The recorded
+            templates_found counts every NC template on the page, while
+            files_uploaded counts unique files: several templates
+            referencing one file are uploaded and counted once.
         """
         logger.info(f"Processing page: {page_title}")
 
@@ -129,44 +148,65 @@ class PageProcessor:
 
         logger.info(f"Found {len(templates)} NC templates")
 
-        # Step 3-4: Process each template
-        replacements: Dict[str, str] = {}
+        # Step 3: Process each unique file once, even when several templates reference it.
+        # Uploads are network-bound, so with upload_workers > 1 files are processed
+        # concurrently; results are then consumed in template order to keep logging
+        # and counting deterministic.
+        results: Dict[str, Dict[str, Any]] = {}
         files_changed: int = 0
         files_exists: int = 0
         files_uploaded: int = 0
         files_duplicate: int = 0
 
-        for template in templates:
-            logger.info(f"Processing file: {template.filename}")
-
-            try:
-                result: Dict[str, any] = self._process_template(template)
+        filenames: List[str] = list(dict.fromkeys(template.filename for template in templates))
+        workers: int = min(self.upload_workers, len(filenames))
 
-            except Exception:
-                logger.exception(f"Exception uploading file {template.filename}")
-                continue
+        outcomes: Dict[str, Dict[str, Any] | None]
+        if workers == 1:
+            # A pool of one only adds thread start-up and hand-off; process in this thread
+            outcomes = {
+                filename: self._safe_result(filename, partial(self._process_file, filename)) for filename in filenames
+            }
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures: Dict[str, Future] = {
+                    filename: executor.submit(self._process_file, filename) for filename in filenames
+                }
+            outcomes = {filename: self._safe_result(filename, future.result) for filename, future in futures.items()}
+
+        for filename, result in outcomes.items():
+            if result is None:
                 # Continue processing other files even if one fails
+                continue
+
+            results[filename] = result
 
             if result["action"] == "exists":
                 files_changed += 1
                 files_exists += 1
-                replacements[template.original_text] = result["replacement"]
-                logger.info(f"File already exists: {template.filename}")
+                logger.info(f"File already exists: {filename}")
 
             elif result["action"] == "uploaded":
                 files_changed += 1
                 files_uploaded += 1
-                replacements[template.original_text] = result["replacement"]
-                logger.info(f"File uploaded successfully: {template.filename}")
+                logger.info(f"File uploaded successfully: {filename}")
 
             elif result["action"] == "duplicate":
                 files_changed += 1
                 files_duplicate += 1
-                replacements[template.original_text] = result["replacement"]
                 logger.info(f"File is duplicate of {result['duplicate_of']}, using existing")
 
             else:
-                logger.info(f"File not uploaded (error: {result.get('error')}): {template.filename}")
+                logger.info(f"File not uploaded (error: {result.get('error')}): {filename}")
+
+        # Step 4: Build replacements for every template whose file was processed
+        replacements: Dict[str, str] = {}
+
+        for template in templates:
+            result = results.get(template.filename)
+            if result is None or result["action"] == "error":
+                continue
+            replacements[template.original_text] = template.to_file_syntax(result.get("duplicate_of"))
 
         # Step 5-6: Update page if there are replacements
         if replacements:
@@ -183,48 +223,43 @@ class PageProcessor:
             logger.info("No files were uploaded, page not modified")
             return False
 
-    def _process_template(self, template: NCTemplate) -> Dict[str, any]:
+    def _process_file(self, filename: str) -> Dict[str, Any]:
         """
-        Process a single NC template (upload file if needed).
+        Process a single file referenced by NC templates (upload if needed).
 
         Args:
-            template: NCTemplate to process.
+            filename: Name of the file to import from NC Commons.
 
         Returns:
             Dictionary with processing result:
-            - {'action': 'exists', 'replacement': '[[File:...]]'}
-            - {'action': 'uploaded', 'replacement': '[[File:...]]'}
-            - {'action': 'duplicate', 'replacement': '...', 'duplicate_of': 'name'}
+            - {'action': 'exists'}
+            - {'action': 'uploaded'}
+            - {'action': 'duplicate', 'duplicate_of': 'name'}
             - {'action': 'error', 'error': 'error_message'}
+
+        Note:
+            Runs on a worker thread of process_page's executor when
+            upload_workers is greater than 1.
         """
+        logger.info(f"Processing file: {filename}")
+
         # First check if file already exists (avoid unnecessary uploads)
-        if self.wiki_api.file_exists(template.filename):
-            return {
-                "action": "exists",
-                "replacement": template.to_file_syntax(),
-            }
+        if self.wiki_api.file_exists(filename):
+            return {"action": "exists"}
 
         # Upload file from NC Commons
-        result = self.uploader.upload_file(template.filename)
+        result = self.uploader.upload_file(filename)
 
         if result.get("success"):
-            return {
-                "action": "uploaded",
-                "replacement": template.to_file_syntax(),
-            }
+            return {"action": "uploaded"}
 
         elif result.get("error") in ("exists", "already_uploaded"):
-            return {
-                "action": "exists",
-                "replacement": template.to_file_syntax(),
-            }
+            return {"action": "exists"}
 
         elif result.get("error") == "duplicate":
-            duplicate_of: str = result.get("duplicate_of", template.filename)
             return {
                 "action": "duplicate",
-                "replacement": template.to_file_syntax(duplicate_of),
-                "duplicate_of": duplicate_of,
+                "duplicate_of": result.get("duplicate_of", filename),
             }
 
         else:
@@ -233,6 +268,24 @@ class PageProcessor:
                 "error": result.get("error"),
             }
 
+    def _safe_result(self, filename: str, get_result: Callable[[], Dict[str, Any]]) -> Dict[str, Any] | None:
+        """
+        Safely collect the result of a _process_file call (never raises).
+
+        Args:
+            filename: Name of the file being processed.
+            get_result: Callable returning the _process_file result, either the
+                call itself or the result() of a future from the upload executor.
+
+        Returns:
+            The _process_file result, or None if processing raised.
+        """
+        try:
+            return get_result()
+        except Exception:
+            logger.exception(f"Exception uploading file {filename}")
+            return None
+
     def _update_page(
         self,
         page_title: str,
@@ -258,9 +311,8 @@ class PageProcessor:
         new_text: str = self._apply_replacements(page_text, replacements)
 
         # Add tracking category if not present
-        category: str = f"[[{self.config['wikipedia']['pagecategory']}]]"
-        if category not in new_text:
-            new_text += f"\n{category}"
+        if self._category_link not in new_text:
+            new_text += f"\n{self._category_link}"
             logger.debug("Added NC Commons category to page")
 
         # Save page
@@ -294,7 +346,10 @@ class PageProcessor:
         Note:
             This uses simple string replacement, which works correctly
             because original_text contains the exact wikitext from the
-            parsed template.
+            parsed template. Replacements run in template order, outer
+            templates before the ones nested in them, so an NC template in
+            another template's caption is carried into the outer file syntax
+            and then replaced there.
         """
         new_text: str = text
 
@@ -85,10 +85,10 @@ class Reporter:
         """
         logger.info("Generating summary report")
 
-        with self.db._get_connection() as conn:
-            # Overall statistics
-            total_stats: Dict[str, int] = self.db.get_statistics()
+        # Overall statistics (opens its own connection, so fetched first)
+        total_stats: Dict[str, int] = self.db.get_statistics()
 
+        with self.db._get_connection() as conn:
             # Per-language statistics
             by_language: List[Dict[str, Any]] = [
                 dict(row)
@@ -123,16 +123,16 @@ class Reporter:
                 ).fetchall()
             ]
 
-            # Build report structure
-            report: Dict[str, Any] = {
-                "total": dict(total_stats),
-                "by_language": by_language,
-                "recent_errors": recent_errors,
-            }
+        # Build report structure
+        report: Dict[str, Any] = {
+            "total": dict(total_stats),
+            "by_language": by_language,
+            "recent_errors": recent_errors,
+        }
 
-            return report
+        return report
 
-    def save_report(self, output_path: str = "./reports/summary.json") -> None:
+    def save_report(self, output_path: str = "./reports/summary.json") -> Dict[str, Any]:
         """
         Generate and save summary report to JSON file.
 
@@ -144,8 +144,11 @@ class Reporter:
                 Parent directories are created automatically.
                 Default: "./reports/summary.json"
 
+        Returns:
+            The report dictionary that was written (see generate_summary()).
+
         Example:
-            >>> reporter.save_report("./output/report.json")
+            >>> report = reporter.save_report("./output/report.json")
             >>> # Report saved to ./output/report.json
 
         Note:
@@ -164,6 +167,7 @@ class Reporter:
             json.dump(report, f, indent=2, ensure_ascii=False)
 
         logger.info(f"Report saved to {output_path}")
+        return report
 
 
 # Standalone script entry point
@@ -26,7 +26,7 @@ Type Parameters:
 import logging
 import time
 from functools import wraps
-from typing import Any, Callable, TypeVar, cast
+from typing import Any, Callable, Optional, TypeVar, cast
 
 logger = logging.getLogger(__name__)
 
@@ -39,6 +39,7 @@ def retry(
     delay: float = 5.0,
     backoff: float = 2.0,
     exceptions: tuple[type[Exception], ...] = (Exception,),
+    sleep_fn: Optional[Callable[[float], None]] = None,
 ) -> Callable[[F], F]:
     """
     Decorator factory that adds retry logic with exponential backoff to functions.
@@ -63,6 +64,9 @@ def retry(
         exceptions: Tuple of exception types to catch and retry on.
             Other exceptions will propagate immediately.
             Default: (Exception,) - catches all exceptions.
+        sleep_fn: Function called with the delay in seconds between attempts.
+            Default: None, meaning time.sleep (looked up at call time).
+            Tests can pass a no-op or a fake clock to avoid waiting.
 
     Returns:
         A decorator function that wraps the target function with retry logic.
@@ -115,7 +119,7 @@ def retry(
                         f"Attempt {attempt}/{max_attempts} failed for {func.__name__}: {e}. "
                         f"Retrying in {current_delay:.1f}s..."
                     )
-                    time.sleep(current_delay)
+                    (sleep_fn or time.sleep)(current_delay)
                     current_delay *= backoff
 
             # This should never be reached due to the raise above,
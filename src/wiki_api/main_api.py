@@ -23,7 +23,8 @@ Example:
 """
 
 import logging
-from typing import Any, Optional
+import threading
+from typing import Any, Dict, List, Optional
 
 import mwclient
 from mwclient.client import Site
@@ -32,6 +33,9 @@ from .upload_handler import UploadHandler
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of titles MediaWiki accepts in one query (for non-bot accounts)
+QUERY_TITLES_LIMIT: int = 50
+
 
 class WikiAPI(UploadHandler):
     """
@@ -91,6 +95,7 @@ class WikiAPI(UploadHandler):
         """
         logger.info(f"Connecting to {site}")
         self.login_done: bool = False
+        self._login_lock: threading.Lock = threading.Lock()
         self.username: Optional[str] = username
         self.password: Optional[str] = password
 
@@ -124,7 +129,8 @@ class WikiAPI(UploadHandler):
         2. Fall back to clientlogin (for bot passwords with 2FA-style auth)
 
         This method is idempotent - subsequent calls return immediately if
-        already logged in.
+        already logged in. It is safe to call from several threads: only one
+        of them performs the login.
 
         Side Effects:
             Sets self.login_done to True on successful authentication.
@@ -141,23 +147,28 @@ class WikiAPI(UploadHandler):
         if self.login_done:
             return
 
-        login_type: str = ""
-        try:
-            logger.info(f"Logging in as {self.username}")
-            self.site.login(self.username, self.password)
-            login_type = "login"
-        except mwclient.errors.LoginError as e:
-            # Bot passwords may require clientlogin instead of standard login
-            if "BotPasswordSessionProvider" in str(e):
-                self.site.clientlogin(None, username=self.username, password=self.password)
-                login_type = "clientlogin"
-            else:
-                logger.exception(f"Login failed for {self.username}: {e}")
+        # Concurrent uploads share this client; the first thread logs in, the rest wait
+        with self._login_lock:
+            if self.login_done:
                 return
 
-        if self.site.logged_in:
-            logger.info(f"Login (action:{login_type}) successful for {self.username}")
-            self.login_done = True
+            login_type: str = ""
+            try:
+                logger.info(f"Logging in as {self.username}")
+                self.site.login(self.username, self.password)
+                login_type = "login"
+            except mwclient.errors.LoginError as e:
+                # Bot passwords may require clientlogin instead of standard login
+                if "BotPasswordSessionProvider" in str(e):
+                    self.site.clientlogin(None, username=self.username, password=self.password)
+                    login_type = "clientlogin"
+                else:
+                    logger.exception(f"Login failed for {self.username}: {e}")
+                    return
+
+            if self.site.logged_in:
+                logger.info(f"Login (action:{login_type}) successful for {self.username}")
+                self.login_done = True
 
     def get_page_text(self, title: str) -> str:
         """
@@ -181,6 +192,42 @@ class WikiAPI(UploadHandler):
         page = self.site.pages[title]
         return page.text()
 
+    def exists_batch(self, titles: List[str]) -> Dict[str, bool]:
+        """
+        Check whether several pages exist, using one API request per 50 titles.
+
+        Equivalent to reading ``self.site.pages[title].exists`` for each
+        title, but batches the titles into action=query&prop=info requests
+        instead of making one request per page.
+
+        Args:
+            titles: Page titles (with namespace prefix where needed,
+                e.g. 'File:Example.jpg').
+
+        Returns:
+            Dictionary mapping each requested title, as given, to True if
+            the page exists and False if it is missing or invalid.
+
+        Example:
+            >>> api.exists_batch(["File:Example.jpg", "Example.jpg"])
+            {'File:Example.jpg': True, 'Example.jpg': False}
+        """
+        normalized: Dict[str, str] = {}
+        by_title: Dict[str, bool] = {}
+
+        for start in range(0, len(titles), QUERY_TITLES_LIMIT):
+            batch = titles[start : start + QUERY_TITLES_LIMIT]
+            logger.debug(f"Checking existence of {len(batch)} pages")
+            query = self.site.api("query", prop="info", titles="|".join(batch)).get("query", {})
+
+            # The API reports normalized titles (e.g. underscores to spaces). Several
+            # requested titles can normalize to the same page, so map each one forward.
+            normalized.update((n["from"], n["to"]) for n in query.get("normalized", []))
+            for page in query.get("pages", {}).values():
+                by_title[page["title"]] = "missing" not in page and "invalid" not in page
+
+        return {title: by_title.get(normalized.get(title, title), False) for title in titles}
+
     def save_page(self, title: str, text: str, summary: str):
         """
         Save new content to a wiki page.
@@ -4,40 +4,99 @@ Pytest fixtures for NC Commons bot tests.
 Provides shared fixtures for mocking and test data.
 """
 
-import tempfile
-from pathlib import Path
-from unittest.mock import Mock
+import os
+import sqlite3
+import time
+import urllib.request
+from types import MappingProxyType
+from unittest.mock import patch
 
 import pytest
-from src.database import Database
-from src.wiki_api import NCCommonsAPI, WikipediaAPI
 
+from .fakes import FakeClock, RecordingDatabase
 
-@pytest.fixture
-def temp_db():
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--run-network", action="store_true", default=False, help="run tests marked network (they reach live wikis)"
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip tests marked network unless --run-network is given."""
+    if config.getoption("--run-network"):
+        return
+
+    skip_network = pytest.mark.skip(reason="needs --run-network")
+    for item in items:
+        if "network" in item.keywords:
+            item.add_marker(skip_network)
+
+
+@pytest.fixture(autouse=True, scope="session")
+def _block_downloads():
+    """Make urllib.request.urlretrieve a no-op Mock for the whole session, so no test downloads a file."""
+    with patch.object(urllib.request, "urlretrieve"):
+        yield
+
+
+@pytest.fixture(autouse=True)
+def fake_clock(monkeypatch):
+    """Replace time.sleep and time.time with a virtual clock, so no test waits in real time."""
+    clock = FakeClock(start=time.time())
+    monkeypatch.setattr(time, "sleep", clock.sleep)
+    monkeypatch.setattr(time, "time", clock.time)
+    return clock
+
+
+# Shared-cache in-memory database, named per pytest-xdist worker ("main" without xdist)
+TEST_DB_URI = f"file:nc_test_db_{os.environ.get('PYTEST_XDIST_WORKER', 'main')}?mode=memory&cache=shared"
+
+
+@pytest.fixture(scope="session")
+def _shared_db():
     """
-    Create a temporary database for testing.
+    Create the in-memory test database and its schema once per session.
 
-    Automatically cleaned up after test.
+    An in-memory database is dropped when its last connection closes, and
+    Database opens a connection per operation, so a keeper connection holds
+    it open for the whole session.
     """
-    # Create temporary file
-    temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=".db")
-    db_path = Path(temp_file.name)
-    temp_file.close()
+    keeper = sqlite3.connect(TEST_DB_URI, uri=True)
+    db = RecordingDatabase(TEST_DB_URI)
+    yield db
+    db.close()
+    keeper.close()
 
-    # Initialize database
-    db = Database(str(db_path))
 
-    yield db
+@pytest.fixture
+def temp_db(_shared_db):
+    """
+    Provide an empty database for testing.
 
-    # Cleanup
-    db_path.unlink(missing_ok=True)
+    Database commits every operation, so tests cannot be wrapped in a
+    transaction; instead the shared in-memory database is emptied after
+    each test, which keeps tests isolated without touching the disk.
+    record_upload calls are also kept in ``temp_db.recorded_uploads``.
+    """
+    yield _shared_db
 
+    _shared_db.recorded_uploads.clear()
+    with _shared_db._get_connection() as conn:
+        conn.execute("DELETE FROM uploads")
+        conn.execute("DELETE FROM pages")
+        conn.execute("DELETE FROM sqlite_sequence")
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
 def sample_config():
-    """Sample configuration dictionary for tests."""
-    return {
+    """
+    Sample configuration for tests.
+
+    Built once per session and read-only at every level, so a test that
+    mutates it fails instead of leaking state into later tests.
+    """
+    config = {
         "nc_commons": {"site": "nccommons.org", "language_page": "User:Mr. Ibrahem/import bot"},
         "wikipedia": {
             "upload_comment": "Bot: import from nccommons.org",
@@ -50,42 +109,14 @@ def sample_config():
             "max_retry_attempts": 3,
             "retry_delay_seconds": 5,
             "retry_backoff_multiplier": 2,
+            "upload_workers": 4,
         },
         "logging": {"level": "INFO", "file": "./test.log"},
     }
+    return MappingProxyType({section: MappingProxyType(values) for section, values in config.items()})
 
 
-@pytest.fixture
-def mock_nc_api():
-    """Mock NC Commons API client."""
-    api = Mock(spec=NCCommonsAPI)
-
-    # Mock methods
-    api.get_page_text.return_value = "Sample page text"
-    api.get_image_url.return_value = "https://nccommons.org/file.jpg"
-    api.get_file_description.return_value = "File description\n[[Category:Test]]"
-
-    return api
-
-
-@pytest.fixture
-def mock_wiki_api():
-    """Mock Wikipedia API client."""
-    api = Mock(spec=WikipediaAPI)
-    api.lang = "en"
-
-    # Mock methods
-    api.get_pages_with_template.return_value = ["Page 1", "Page 2"]
-    api.get_page_text.return_value = "{{NC|test.jpg|caption}}"
-    api.save_page.return_value = None
-    api.upload_from_url.return_value = {"success": True}
-    api.upload_from_file.return_value = {"success": True}
-    api.file_exists.return_value = False  # Files don't exist by default
-
-    return api
-
-
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_language_list_page():
     """Sample language list page content."""
     return """
@@ -95,7 +126,7 @@ def sample_language_list_page():
     """
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_nc_template_page():
     """Sample Wikipedia page with NC templates."""
     return """
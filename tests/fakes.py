@@ -0,0 +1,239 @@
+"""
+Hand-written test doubles for NC Commons bot tests.
+
+These replace Mock objects in the page processing and upload tests: calls
+are recorded in plain lists and results are plain attributes. The Stub*
+API doubles expose only the methods the code under test uses, each a
+CallRecorder that keeps the small part of the Mock API the tests rely on.
+"""
+
+import sqlite3
+from collections import namedtuple
+from unittest.mock import call
+
+from src.database import Database
+
+SaveCall = namedtuple("SaveCall", "title text summary")
+
+# Canned Site.raw_call responses from the MediaWiki upload API
+SUCCESS_JSON = '{"upload": {"result": "Success"}}'
+DUP_JSON = '{"upload": {"warnings": {"duplicate": ["Existing_file.jpg"]}}}'
+
+
+class FakeUploader:
+    """
+    Hand-written stand-in for FileUploader used by PageProcessor tests.
+
+    Records every upload_file call and replays canned results. Results are
+    looked up per filename in ``results`` and fall back to ``default``; an
+    Exception instance is raised instead of returned.
+    """
+
+    def __init__(self, default=None):
+        self.reset(default)
+
+    def reset(self, default=None):
+        """Forget recorded calls and canned results."""
+        self.default = default if default is not None else {"success": True}
+        self.results = {}
+        self.calls = []
+
+    def upload_file(self, filename):
+        self.calls.append(filename)
+        result = self.results.get(filename, self.default)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+
+class FakeWikiApi:
+    """
+    Hand-written stand-in for WikipediaAPI used by PageProcessor tests.
+
+    ``page_text`` is returned from get_page_text (or raised if it is an
+    Exception), ``existing_files`` drives file_exists, and every save_page
+    call is appended to ``saves`` as a SaveCall(title, text, summary).
+    """
+
+    def __init__(self, lang="en", page_text=""):
+        self.reset(lang, page_text)
+
+    def reset(self, lang="en", page_text=""):
+        """Forget saved pages and restore the initial state."""
+        self.lang = lang
+        self.page_text = page_text
+        self.existing_files = set()
+        self.saves = []
+
+    def get_page_text(self, title):
+        if isinstance(self.page_text, Exception):
+            raise self.page_text
+        return self.page_text
+
+    def file_exists(self, filename):
+        return filename in self.existing_files
+
+    def save_page(self, title, text, summary):
+        self.saves.append(SaveCall(title, text, summary))
+        return True
+
+
+class RecordingDatabase(Database):
+    """
+    Database that also keeps every record_upload call in ``recorded_uploads``.
+
+    Lets tests assert on what was recorded without opening another
+    connection to query it back. Rows written by record_uploads_bulk are
+    not captured; ro_cursor() reads those back on one cached, read-only
+    connection, which close() releases.
+    """
+
+    def __init__(self, db_path):
+        self.recorded_uploads = []
+        self._ro_conn = None
+        super().__init__(db_path)
+
+    def ro_cursor(self):
+        """Cursor on a cached connection that sees every committed write and cannot write itself."""
+        if self._ro_conn is None:
+            # Autocommit mode: never hold a transaction (and its locks) open between reads
+            if self._uri is not None:
+                conn = sqlite3.connect(self._uri, uri=True, isolation_level=None)
+            else:
+                conn = sqlite3.connect(str(self.db_path), isolation_level=None)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA query_only = ON")
+            self._ro_conn = conn
+        return self._ro_conn.cursor()
+
+    def close(self):
+        """Close the ro_cursor() connection, if open."""
+        if self._ro_conn is not None:
+            self._ro_conn.close()
+            self._ro_conn = None
+
+    def record_upload(self, filename, language, status, error=None):
+        self.recorded_uploads.append({"filename": filename, "language": language, "status": status, "error": error})
+        super().record_upload(filename, language, status, error)
+
+
+class CallRecorder:
+    """
+    Minimal stand-in for a Mock method.
+
+    Returns ``return_value``, or raises ``side_effect`` if it is an exception
+    (calls it if it is callable), and records every call as a
+    unittest.mock.call in ``calls``.
+    """
+
+    __slots__ = ("return_value", "side_effect", "calls")
+
+    def __init__(self, return_value=None):
+        self.return_value = return_value
+        self.side_effect = None
+        self.calls = []
+
+    def __call__(self, *args, **kwargs):
+        self.calls.append(call(*args, **kwargs))
+        if isinstance(self.side_effect, BaseException):
+            raise self.side_effect
+        if callable(self.side_effect):
+            return self.side_effect(*args, **kwargs)
+        return self.return_value
+
+    @property
+    def call_count(self):
+        return len(self.calls)
+
+    @property
+    def call_args(self):
+        return self.calls[-1] if self.calls else None
+
+    def assert_not_called(self):
+        assert not self.calls, f"Expected no calls, got {self.calls}"
+
+    def assert_called_once(self):
+        assert len(self.calls) == 1, f"Expected 1 call, got {self.calls}"
+
+
+class StubNcApi:
+    """Stand-in for NCCommonsAPI used by FileUploader tests; reset() restores the defaults."""
+
+    __slots__ = ("get_page_text", "get_image_url", "get_file_description")
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        """Forget recorded calls and restore the default return values."""
+        self.get_page_text = CallRecorder("Sample page text")
+        self.get_image_url = CallRecorder("https://nccommons.org/file.jpg")
+        self.get_file_description = CallRecorder("File description\n[[Category:Test]]")
+
+
+class StubWikiApi:
+    """Stand-in for WikipediaAPI used by FileUploader tests; reset() restores the defaults."""
+
+    __slots__ = (
+        "lang",
+        "get_pages_with_template",
+        "get_page_text",
+        "save_page",
+        "upload_from_url",
+        "upload_from_file",
+        "file_exists",
+    )
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        """Forget recorded calls and restore the default language and return values."""
+        self.lang = "en"
+        self.get_pages_with_template = CallRecorder(["Page 1", "Page 2"])
+        self.get_page_text = CallRecorder("{{NC|test.jpg|caption}}")
+        self.save_page = CallRecorder(None)
+        self.upload_from_url = CallRecorder({"success": True})
+        self.upload_from_file = CallRecorder({"success": True})
+        self.file_exists = CallRecorder(False)  # Files don't exist by default
+
+
+class FakeClock:
+    """
+    Virtual clock standing in for time.sleep and time.time.
+
+    sleep() returns immediately, advancing ``now`` and recording the requested
+    delay in ``sleeps``, so backoff delays can be asserted exactly.
+    """
+
+    __slots__ = ("now", "sleeps")
+
+    def __init__(self, start=0.0):
+        self.now = start
+        self.sleeps = []
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+    def time(self):
+        return self.now
+
+
+class DictAccess:
+    """
+    Read-only stand-in for mwclient's site.pages / site.images listings.
+
+    Every lookup returns the same canned ``page`` and records the requested
+    title in ``keys``.
+    """
+
+    __slots__ = ("page", "keys")
+
+    def __init__(self, page):
+        self.page = page
+        self.keys = []
+
+    def __getitem__(self, title):
+        self.keys.append(title)
+        return self.page
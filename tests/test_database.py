@@ -2,6 +2,8 @@
 Tests for database operations.
 """
 
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 from src.database import Database
 
@@ -12,58 +14,96 @@ class TestDatabase:
     def test_database_initialization(self, temp_db):
         """Test database initializes correctly."""
         # Tables should exist
-        with temp_db._get_connection() as conn:
-            tables = conn.execute("SELECT name FROM sqlite_master WHERE type='table'").fetchall()
+        tables = temp_db.ro_cursor().execute("SELECT name FROM sqlite_master WHERE type='table'").fetchall()
+
+        table_names = [t["name"] for t in tables]
+        assert "uploads" in table_names
+        assert "pages" in table_names
 
-            table_names = [t["name"] for t in tables]
-            assert "uploads" in table_names
-            assert "pages" in table_names
+    def test_db_path_only_for_files(self, temp_db, tmp_path):
+        """Test db_path is set for a database file and left None for a URI."""
+        path = tmp_path / "sub" / "bot.db"
+
+        assert Database(str(path)).db_path == path
+        assert path.exists()
+        assert temp_db.db_path is None
 
     def test_record_upload_success(self, temp_db):
         """Test recording a successful upload."""
         temp_db.record_upload("test.jpg", "en", "success")
 
         # Verify record exists
-        with temp_db._get_connection() as conn:
-            result = conn.execute("SELECT * FROM uploads WHERE filename='test.jpg'").fetchone()
+        result = temp_db.get_upload("test.jpg")
 
-            assert result is not None
-            assert result["filename"] == "test.jpg"
-            assert result["language"] == "en"
-            assert result["status"] == "success"
-            assert result["error"] is None
+        assert result is not None
+        assert result["filename"] == "test.jpg"
+        assert result["language"] == "en"
+        assert result["status"] == "success"
+        assert result["error"] is None
 
     def test_record_upload_failed(self, temp_db):
         """Test recording a failed upload."""
         temp_db.record_upload("fail.jpg", "ar", "failed", "Error message")
 
-        with temp_db._get_connection() as conn:
-            result = conn.execute("SELECT * FROM uploads WHERE filename='fail.jpg'").fetchone()
+        result = temp_db.get_upload("fail.jpg")
 
-            assert result["status"] == "failed"
-            assert result["error"] == "Error message"
+        assert result["status"] == "failed"
+        assert result["error"] == "Error message"
 
     def test_record_upload_duplicate(self, temp_db):
         """Test recording duplicate file."""
         temp_db.record_upload("dup.jpg", "en", "duplicate")
 
-        with temp_db._get_connection() as conn:
-            result = conn.execute("SELECT * FROM uploads WHERE filename='dup.jpg'").fetchone()
+        result = temp_db.get_upload("dup.jpg")
+
+        assert result["status"] == "duplicate"
+
+    def test_record_uploads_bulk(self, temp_db):
+        """Test recording several uploads in one call."""
+        temp_db.record_uploads_bulk(
+            [
+                ("a.jpg", "en", "success", None),
+                ("b.jpg", "en", "failed", "Network error"),
+                ("c.jpg", "ar", "duplicate", "duplicate_of:a.jpg"),
+            ]
+        )
+
+        rows = temp_db.ro_cursor().execute("SELECT filename, language, status, error FROM uploads ORDER BY id")
+
+        assert [tuple(row) for row in rows] == [
+            ("a.jpg", "en", "success", None),
+            ("b.jpg", "en", "failed", "Network error"),
+            ("c.jpg", "ar", "duplicate", "duplicate_of:a.jpg"),
+        ]
 
-            assert result["status"] == "duplicate"
+    def test_record_uploads_bulk_empty(self, temp_db):
+        """Test bulk recording with no rows is a no-op."""
+        temp_db.record_uploads_bulk([])
+
+        assert temp_db.get_statistics()["total_uploads"] == 0
+
+    def test_get_upload_latest_for_language(self, temp_db):
+        """Test get_upload returns the latest record, optionally for one language."""
+        temp_db.record_upload("retry.jpg", "en", "failed", "Timeout")
+        temp_db.record_upload("retry.jpg", "en", "success")
+        temp_db.record_upload("retry.jpg", "ar", "failed", "Error")
+
+        assert temp_db.get_upload("retry.jpg", "en")["status"] == "success"
+        assert temp_db.get_upload("retry.jpg")["language"] == "ar"
+        assert temp_db.get_upload("retry.jpg", "fr") is None
+        assert temp_db.get_upload("missing.jpg") is None
 
     def test_record_page_processing(self, temp_db):
         """Test recording page processing."""
         temp_db.record_page_processing("Test Page", "en", 3, 2)
 
-        with temp_db._get_connection() as conn:
-            result = conn.execute("SELECT * FROM pages WHERE page_title='Test Page'").fetchone()
+        result = temp_db.ro_cursor().execute("SELECT * FROM pages WHERE page_title='Test Page'").fetchone()
 
-            assert result is not None
-            assert result["page_title"] == "Test Page"
-            assert result["language"] == "en"
-            assert result["templates_found"] == 3
-            assert result["files_uploaded"] == 2
+        assert result is not None
+        assert result["page_title"] == "Test Page"
+        assert result["language"] == "en"
+        assert result["templates_found"] == 3
+        assert result["files_uploaded"] == 2
 
     def test_is_file_uploaded_true(self, temp_db):
         """Test checking if file is uploaded (true case)."""
@@ -113,52 +153,47 @@ class TestDatabase:
         """Test recording upload with special characters in filename."""
         temp_db.record_upload("file's name (2).jpg", "en", "success")
 
-        with temp_db._get_connection() as conn:
-            result = conn.execute("SELECT * FROM uploads WHERE filename=?", ("file's name (2).jpg",)).fetchone()
+        result = temp_db.get_upload("file's name (2).jpg")
 
-            assert result is not None
-            assert result["filename"] == "file's name (2).jpg"
+        assert result is not None
+        assert result["filename"] == "file's name (2).jpg"
 
     def test_record_upload_with_unicode_filename(self, temp_db):
         """Test recording upload with unicode characters."""
         temp_db.record_upload("测试文件.jpg", "zh", "success")
 
-        with temp_db._get_connection() as conn:
-            result = conn.execute("SELECT * FROM uploads WHERE filename='测试文件.jpg'").fetchone()
+        result = temp_db.get_upload("测试文件.jpg")
 
-            assert result is not None
-            assert result["filename"] == "测试文件.jpg"
+        assert result is not None
+        assert result["filename"] == "测试文件.jpg"
 
     def test_record_upload_with_long_error_message(self, temp_db):
         """Test recording upload with very long error message."""
         long_error = "Error: " + "x" * 10000
         temp_db.record_upload("fail.jpg", "en", "failed", long_error)
 
-        with temp_db._get_connection() as conn:
-            result = conn.execute("SELECT error FROM uploads WHERE filename='fail.jpg'").fetchone()
+        result = temp_db.get_upload("fail.jpg")
 
-            assert result["error"] == long_error
+        assert result["error"] == long_error
 
     def test_record_page_processing_with_zero_values(self, temp_db):
         """Test recording page with zero templates and uploads."""
         temp_db.record_page_processing("Empty Page", "en", 0, 0)
 
-        with temp_db._get_connection() as conn:
-            result = conn.execute("SELECT * FROM pages WHERE page_title='Empty Page'").fetchone()
+        result = temp_db.ro_cursor().execute("SELECT * FROM pages WHERE page_title='Empty Page'").fetchone()
 
-            assert result is not None
-            assert result["templates_found"] == 0
-            assert result["files_uploaded"] == 0
+        assert result is not None
+        assert result["templates_found"] == 0
+        assert result["files_uploaded"] == 0
 
     def test_record_page_processing_with_unicode_title(self, temp_db):
         """Test recording page with unicode characters in title."""
         temp_db.record_page_processing("页面标题", "zh", 5, 3)
 
-        with temp_db._get_connection() as conn:
-            result = conn.execute("SELECT * FROM pages WHERE page_title='页面标题'").fetchone()
+        result = temp_db.ro_cursor().execute("SELECT * FROM pages WHERE page_title='页面标题'").fetchone()
 
-            assert result is not None
-            assert result["page_title"] == "页面标题"
+        assert result is not None
+        assert result["page_title"] == "页面标题"
 
     def test_is_file_uploaded_different_languages(self, temp_db):
         """Test that file upload status is language-specific."""
@@ -203,3 +238,15 @@ class TestDatabase:
 
         stats = temp_db.get_statistics("en")
         assert stats["total_uploads"] == 100
+
+    def test_record_upload_from_threads(self, temp_db):
+        """Test one Database shared by several threads records every upload."""
+
+        def record(worker):
+            for i in range(50):
+                temp_db.record_upload(f"w{worker}_{i}.jpg", "en", "success")
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(record, range(8)))
+
+        assert temp_db.get_statistics("en")["total_uploads"] == 400
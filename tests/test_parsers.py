@@ -2,8 +2,17 @@
 Tests for wikitext parsing functions.
 """
 
+from dataclasses import FrozenInstanceError
+
 import pytest
-from src.parsers import NCTemplate, extract_nc_templates, parse_language_list, remove_categories
+import wikitextparser as wtp
+from src.parsers import (
+    NCTemplate,
+    extract_nc_templates,
+    extract_nc_templates_from_parsed,
+    parse_language_list,
+    remove_categories,
+)
 
 
 class TestParseLanguageList:
@@ -81,6 +90,12 @@ class TestExtractNCTemplates:
 
         assert templates == []
 
+    def test_extract_from_parsed_matches_string_api(self, sample_nc_template_page):
+        """Test extracting from a pre-parsed page gives the same templates."""
+        parsed = wtp.parse(sample_nc_template_page)
+
+        assert extract_nc_templates_from_parsed(parsed) == extract_nc_templates(sample_nc_template_page)
+
 
 class TestNCTemplate:
     """Tests for NCTemplate dataclass."""
@@ -309,3 +324,19 @@ class TestNCTemplateEdgeCases:
         template = NCTemplate(original_text=original, filename="test.jpg", caption="Caption")
 
         assert template.original_text == original
+
+    def test_template_is_immutable(self):
+        """Test that NCTemplate fields cannot be reassigned."""
+        template = NCTemplate(original_text="{{NC|test.jpg}}", filename="test.jpg")
+
+        with pytest.raises(FrozenInstanceError):
+            template.filename = "other.jpg"
+
+        assert not hasattr(template, "__dict__")
+
+    def test_to_file_syntax_ignores_original_text(self):
+        """Test that templates with the same file and caption give the same syntax, however they were written."""
+        first = NCTemplate(original_text="{{NC|test.jpg|Caption}}", filename="test.jpg", caption="Caption")
+        second = NCTemplate(original_text="{{NC| test.jpg |Caption}}", filename="test.jpg", caption="Caption")
+
+        assert first.to_file_syntax() == second.to_file_syntax() == "[[File:test.jpg|thumb|Caption]]"
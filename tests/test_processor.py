@@ -2,49 +2,99 @@
 Tests for page processor module.
 """
 
-from unittest.mock import MagicMock, Mock
+import threading
+from unittest.mock import MagicMock, Mock, create_autospec
 
 import pytest
-from src.parsers import NCTemplate
-from src.processor import PageProcessor
+from mwclient import Site
+from src.processor import DEFAULT_UPLOAD_WORKERS, PageProcessor
+from src.wiki_api import WikipediaAPI, main_api
+
+from .fakes import SUCCESS_JSON, FakeUploader, FakeWikiApi
+
+PROCESSOR_CONFIG = {"wikipedia": {"pagecategory": "Category:Contains images from NC Commons"}}
+_CAT = "[[Category:Contains images from NC Commons]]"
+
+
+@pytest.fixture(scope="module")
+def processor(_shared_db):
+    """Create one PageProcessor shared by every test in this module."""
+    return PageProcessor(FakeWikiApi(), FakeUploader(), _shared_db, PROCESSOR_CONFIG)
+
+
+@pytest.fixture(autouse=True)
+def _reset(processor, temp_db):
+    """Restore the shared processor's collaborators after each test (temp_db empties the database)."""
+    yield
+    processor.wiki_api.reset()
+    processor.uploader.reset()
+
+
+@pytest.fixture
+def fake_wiki_api(processor):
+    """Wikipedia API stub wired into the shared processor."""
+    return processor.wiki_api
+
+
+@pytest.fixture
+def fake_uploader(processor):
+    """FileUploader stub wired into the shared processor."""
+    return processor.uploader
+
+
+@pytest.fixture
+def mock_site(monkeypatch):
+    """Autospec'd mwclient Site returned to a real WikipediaAPI for the duration of a test."""
+    site = create_autospec(Site, instance=True)
+    site.pages = MagicMock()
+    site.images = MagicMock()
+    # Set by Site.__init__ and login, so not part of the class spec
+    site.logged_in = True
+    site.host = "en.wikipedia.org"
+    site.username = "user"
+    monkeypatch.setattr(main_api, "Site", Mock(return_value=site))
+    return site
+
+
+class _UrlUploader:
+    """Uploads every file by URL through the given API, once all workers have started."""
+
+    def __init__(self, wiki_api, workers):
+        self.wiki_api = wiki_api
+        self.started = threading.Barrier(workers)
+
+    def upload_file(self, filename):
+        self.started.wait(timeout=5)
+        return self.wiki_api.upload_from_url(filename, f"https://nccommons.org/{filename}", "Description", "Comment")
 
 
 class TestPageProcessor:
     """Tests for PageProcessor class."""
 
-    @pytest.fixture
-    def processor(self, mock_wiki_api, temp_db, sample_config):
-        """Create PageProcessor instance for testing."""
-        mock_uploader = Mock()
-        return PageProcessor(mock_wiki_api, mock_uploader, temp_db, sample_config)
-
-    def test_processor_initialization(self, mock_wiki_api, temp_db, sample_config):
+    def test_processor_initialization(self, fake_wiki_api, fake_uploader, temp_db, sample_config):
         """Test processor initializes correctly."""
-        mock_uploader = Mock()
-        processor = PageProcessor(mock_wiki_api, mock_uploader, temp_db, sample_config)
+        processor = PageProcessor(fake_wiki_api, fake_uploader, temp_db, sample_config)
 
-        assert processor.wiki_api == mock_wiki_api
-        assert processor.uploader == mock_uploader
+        assert processor.wiki_api == fake_wiki_api
+        assert processor.uploader == fake_uploader
         assert processor.db == temp_db
         assert processor.config == sample_config
 
-    def test_process_page_no_templates(self, processor, mock_wiki_api, temp_db):
+    def test_process_page_no_templates(self, processor, fake_wiki_api, temp_db):
         """Test processing page with no NC templates."""
-        mock_wiki_api.get_page_text.return_value = "Just plain text, no templates."
-        mock_wiki_api.lang = "en"
+        fake_wiki_api.page_text = "Just plain text, no templates."
 
         result = processor.process_page("Test Page")
 
         assert result is False
 
         # Should record page with 0 templates and 0 uploads
-        with temp_db._get_connection() as conn:
-            record = conn.execute("SELECT * FROM pages WHERE page_title='Test Page'").fetchone()
-            assert record is not None
-            assert record["templates_found"] == 0
-            assert record["files_uploaded"] == 0
+        record = temp_db.ro_cursor().execute("SELECT * FROM pages WHERE page_title='Test Page'").fetchone()
+        assert record is not None
+        assert record["templates_found"] == 0
+        assert record["files_uploaded"] == 0
 
-    def test_process_page_with_templates_successful_uploads(self, processor, mock_wiki_api, temp_db):
+    def test_process_page_with_templates_successful_uploads(self, processor, fake_wiki_api, fake_uploader, temp_db):
         """Test processing page with NC templates and successful uploads."""
         page_text = """
         Some text here.
@@ -53,158 +103,108 @@ class TestPageProcessor:
         {{NC|file2.jpg|Caption 2}}
         """
 
-        mock_wiki_api.get_page_text.return_value = page_text
-        mock_wiki_api.lang = "en"
-
-        # Mock successful uploads
-        processor.uploader.upload_file.return_value = {"success": True}
+        fake_wiki_api.page_text = page_text
 
         result = processor.process_page("Test Page")
 
         assert result is True
 
         # Verify uploads were attempted
-        assert processor.uploader.upload_file.call_count == 2
+        assert len(fake_uploader.calls) == 2
 
         # Verify page was saved
-        mock_wiki_api.save_page.assert_called_once()
+        assert len(fake_wiki_api.saves) == 1
+        assert fake_wiki_api.saves[-1].title == "Test Page"
 
         # Verify database record
-        with temp_db._get_connection() as conn:
-            record = conn.execute("SELECT * FROM pages WHERE page_title='Test Page'").fetchone()
-            assert record["templates_found"] == 2
-            assert record["files_uploaded"] == 2
+        record = temp_db.ro_cursor().execute("SELECT * FROM pages WHERE page_title='Test Page'").fetchone()
+        assert record["templates_found"] == 2
+        assert record["files_uploaded"] == 2
 
-    def test_process_page_partial_upload_success(self, processor, mock_wiki_api, temp_db):
+    def test_process_page_partial_upload_success(self, processor, fake_wiki_api, fake_uploader, temp_db):
         """Test processing when only some files upload successfully."""
         page_text = """
         {{NC|success.jpg|Caption 1}}
         {{NC|fail.jpg|Caption 2}}
         """
 
-        mock_wiki_api.get_page_text.return_value = page_text
-        mock_wiki_api.lang = "en"
+        fake_wiki_api.page_text = page_text
 
         # First upload succeeds, second fails
-        processor.uploader.upload_file.side_effect = [{"success": True}, {"success": False, "error": "exists"}]
+        fake_uploader.results["fail.jpg"] = {"success": False, "error": "exists"}
 
         result = processor.process_page("Test Page")
 
         assert result is True  # Page should still be updated
 
         # Verify page record
-        with temp_db._get_connection() as conn:
-            record = conn.execute("SELECT * FROM pages WHERE page_title='Test Page'").fetchone()
-            assert record["templates_found"] == 2
-            assert record["files_uploaded"] == 1  # Only one succeeded
+        record = temp_db.ro_cursor().execute("SELECT * FROM pages WHERE page_title='Test Page'").fetchone()
+        assert record["templates_found"] == 2
+        assert record["files_uploaded"] == 1  # Only one succeeded
 
-    def test_process_page_no_uploads_successful(self, processor, mock_wiki_api, temp_db):
+    def test_process_page_no_uploads_successful(self, processor, fake_wiki_api, fake_uploader, temp_db):
         """Test processing when no uploads succeed."""
-        page_text = "{{NC|fail.jpg|Caption}}"
-
-        mock_wiki_api.get_page_text.return_value = page_text
-        mock_wiki_api.lang = "en"
+        fake_wiki_api.page_text = "{{NC|fail.jpg|Caption}}"
 
         # Upload fails
-        processor.uploader.upload_file.return_value = {"success": False, "error": "failed"}
+        fake_uploader.default = {"success": False, "error": "failed"}
 
         result = processor.process_page("Test Page")
 
         assert result is False  # Page not modified
 
         # Page should not be saved
-        mock_wiki_api.save_page.assert_not_called()
+        assert fake_wiki_api.saves == []
 
         # Database should still record the attempt
-        with temp_db._get_connection() as conn:
-            record = conn.execute("SELECT * FROM pages WHERE page_title='Test Page'").fetchone()
-            assert record["templates_found"] == 1
-            assert record["files_uploaded"] == 0
-
-    def test_process_page_adds_category(self, processor, mock_wiki_api, temp_db, sample_config):
-        """Test that processing adds NC Commons category."""
-        page_text = "{{NC|test.jpg|Caption}}"
-
-        mock_wiki_api.get_page_text.return_value = page_text
-        mock_wiki_api.lang = "en"
-        processor.uploader.upload_file.return_value = {"success": True}
-
-        processor.process_page("Test Page")
-
-        # Check the saved text
-        call_args = mock_wiki_api.save_page.call_args
-        saved_text = call_args[0][1]  # Second positional argument
-
-        expected_category = sample_config["wikipedia"]["pagecategory"]
-        assert f"[[{expected_category}]]" in saved_text
-
-    def test_process_page_doesnt_duplicate_category(self, processor, mock_wiki_api, temp_db, sample_config):
-        """Test that category isn't added if already present."""
-        category = sample_config["wikipedia"]["pagecategory"]
-        page_text = f"{{{{NC|test.jpg|Caption}}}}\n[[{category}]]"
-
-        mock_wiki_api.get_page_text.return_value = page_text
-        mock_wiki_api.lang = "en"
-        processor.uploader.upload_file.return_value = {"success": True}
-
-        processor.process_page("Test Page")
-
-        # Check the saved text
-        call_args = mock_wiki_api.save_page.call_args
-        saved_text = call_args[0][1]
-
-        # Should only appear once
-        assert saved_text.count(f"[[{category}]]") == 1
-
-    def test_process_page_replaces_templates_with_file_syntax(self, processor, mock_wiki_api, temp_db):
-        """Test that NC templates are replaced with file syntax."""
-        page_text = "Text before\n{{NC|test.jpg|My caption}}\nText after"
-
-        mock_wiki_api.get_page_text.return_value = page_text
-        mock_wiki_api.lang = "en"
-        processor.uploader.upload_file.return_value = {"success": True}
-
-        processor.process_page("Test Page")
-
-        # Check the saved text
-        call_args = mock_wiki_api.save_page.call_args
-        saved_text = call_args[0][1]
-
-        # Original template should be gone
-        assert "{{NC|test.jpg|My caption}}" not in saved_text
-
-        # Should be replaced with file syntax
-        assert "[[File:test.jpg|thumb|My caption]]" in saved_text
-
-        # Other text should remain
-        assert "Text before" in saved_text
-        assert "Text after" in saved_text
-
-    def test_process_page_summary_message(self, processor, mock_wiki_api, temp_db):
+        record = temp_db.ro_cursor().execute("SELECT * FROM pages WHERE page_title='Test Page'").fetchone()
+        assert record["templates_found"] == 1
+        assert record["files_uploaded"] == 0
+
+    @pytest.mark.parametrize(
+        ("page_text", "expected_counts"),
+        [
+            pytest.param("{{NC|test.jpg|Caption}}", {_CAT: 1}, id="adds_category"),
+            pytest.param(f"{{{{NC|test.jpg|Caption}}}}\n{_CAT}", {_CAT: 1}, id="doesnt_duplicate_category"),
+            pytest.param(
+                "Text before\n{{NC|test.jpg|My caption}}\nText after",
+                {
+                    "{{NC|test.jpg|My caption}}": 0,
+                    "[[File:test.jpg|thumb|My caption]]": 1,
+                    "Text before": 1,
+                    "Text after": 1,
+                },
+                id="replaces_templates_with_file_syntax",
+            ),
+            pytest.param("{{NC|test.jpg}}", {"[[File:test.jpg|thumb]]": 1}, id="empty_caption"),
+        ],
+    )
+    def test_process_page_saved_text(self, processor, fake_wiki_api, page_text, expected_counts):
+        """Test the text saved for a page: template replacement and tracking category."""
+        fake_wiki_api.page_text = page_text
+
+        assert processor.process_page("Test Page") is True
+
+        saved_text = fake_wiki_api.saves[-1].text
+        assert {needle: saved_text.count(needle) for needle in expected_counts} == expected_counts
+
+    def test_process_page_summary_message(self, processor, fake_wiki_api, temp_db):
         """Test that save summary is correct."""
-        page_text = "{{NC|file1.jpg|C1}}\n{{NC|file2.jpg|C2}}"
-
-        mock_wiki_api.get_page_text.return_value = page_text
-        mock_wiki_api.lang = "en"
-        processor.uploader.upload_file.return_value = {"success": True}
+        fake_wiki_api.page_text = "{{NC|file1.jpg|C1}}\n{{NC|file2.jpg|C2}}"
 
         processor.process_page("Test Page")
 
         # Check the summary
-        call_args = mock_wiki_api.save_page.call_args
-        summary = call_args[0][2]  # Third positional argument
+        summary = fake_wiki_api.saves[-1].summary
 
         assert "Bot: Imported 2 file(s) from NC Commons" in summary
 
-    def test_process_page_handles_upload_exception(self, processor, mock_wiki_api, temp_db):
+    def test_process_page_handles_upload_exception(self, processor, fake_wiki_api, fake_uploader, temp_db):
         """Test that page processing continues on upload exception."""
-        page_text = "{{NC|error.jpg|C1}}\n{{NC|success.jpg|C2}}"
-
-        mock_wiki_api.get_page_text.return_value = page_text
-        mock_wiki_api.lang = "en"
+        fake_wiki_api.page_text = "{{NC|error.jpg|C1}}\n{{NC|success.jpg|C2}}"
 
         # First raises exception, second succeeds
-        processor.uploader.upload_file.side_effect = [Exception("Upload error"), {"success": True}]
+        fake_uploader.results["error.jpg"] = Exception("Upload error")
 
         result = processor.process_page("Test Page")
 
@@ -212,19 +212,18 @@ class TestPageProcessor:
         assert result is True
 
         # Both uploads should have been attempted
-        assert processor.uploader.upload_file.call_count == 2
+        assert len(fake_uploader.calls) == 2
 
-    def test_process_page_handles_page_fetch_error(self, processor, mock_wiki_api, temp_db):
+    def test_process_page_handles_page_fetch_error(self, processor, fake_wiki_api, temp_db):
         """Test handling error when fetching page."""
-        mock_wiki_api.get_page_text.side_effect = Exception("Page not found")
-        mock_wiki_api.lang = "en"
+        fake_wiki_api.page_text = Exception("Page not found")
 
         result = processor.process_page("Missing Page")
 
         assert result is False
 
         # Should not save page
-        mock_wiki_api.save_page.assert_not_called()
+        assert fake_wiki_api.saves == []
 
     def test_apply_replacements(self, processor):
         """Test _apply_replacements method."""
@@ -237,13 +236,17 @@ class TestPageProcessor:
 
         result = processor._apply_replacements(text, replacements)
 
-        assert "{{NC|file1.jpg|Cap1}}" not in result
-        assert "{{NC|file2.jpg|Cap2}}" not in result
-        assert "[[File:file1.jpg|thumb|Cap1]]" in result
-        assert "[[File:file2.jpg|thumb|Cap2]]" in result
-        assert "Start" in result
-        assert "middle" in result
-        assert "end" in result
+        # One comparison covers every replacement and all surrounding text
+        assert result == "Start [[File:file1.jpg|thumb|Cap1]] middle [[File:file2.jpg|thumb|Cap2]] end"
+
+    def test_process_page_nested_template_in_caption(self, processor, fake_wiki_api):
+        """Test an NC template nested in another NC template's caption is replaced too."""
+        fake_wiki_api.page_text = "A {{NC|outer.jpg|See {{NC|inner.jpg}}}} B"
+
+        assert processor.process_page("Test Page") is True
+
+        saved_text = fake_wiki_api.saves[-1].text
+        assert saved_text == f"A [[File:outer.jpg|thumb|See [[File:inner.jpg|thumb]]]] B\n{_CAT}"
 
     def test_apply_replacements_empty(self, processor):
         """Test _apply_replacements with no replacements."""
@@ -253,67 +256,47 @@ class TestPageProcessor:
 
         assert result == text
 
-    def test_process_page_multiple_templates_same_file(self, processor, mock_wiki_api, temp_db):
+    def test_process_page_multiple_templates_same_file(self, processor, fake_wiki_api, fake_uploader, temp_db):
         """Test processing page with multiple references to same file."""
-        page_text = """
+        fake_wiki_api.page_text = """
         {{NC|same.jpg|First use}}
         Some text
         {{NC|same.jpg|Second use}}
         """
 
-        mock_wiki_api.get_page_text.return_value = page_text
-        mock_wiki_api.lang = "en"
-        processor.uploader.upload_file.return_value = {"success": True}
-
         processor.process_page("Test Page")
 
-        # Upload should be attempted for each template
-        assert processor.uploader.upload_file.call_count == 2
+        # Upload should be attempted once per unique file
+        assert fake_uploader.calls == ["same.jpg"]
 
         # Both templates should be replaced
-        call_args = mock_wiki_api.save_page.call_args
-        saved_text = call_args[0][1]
+        saved_text = fake_wiki_api.saves[-1].text
 
         assert saved_text.count("[[File:same.jpg|thumb|") == 2
 
-    def test_process_page_records_language(self, processor, mock_wiki_api, temp_db):
+        # Both templates are counted, the shared file only once
+        record = temp_db.ro_cursor().execute("SELECT * FROM pages WHERE page_title='Test Page'").fetchone()
+        assert (record["templates_found"], record["files_uploaded"]) == (2, 1)
+
+    def test_process_page_records_language(self, processor, fake_wiki_api, temp_db):
         """Test that processor records correct language."""
-        mock_wiki_api.get_page_text.return_value = "{{NC|test.jpg|Caption}}"
-        mock_wiki_api.lang = "ar"  # Arabic
-        processor.uploader.upload_file.return_value = {"success": True}
+        fake_wiki_api.page_text = "{{NC|test.jpg|Caption}}"
+        fake_wiki_api.lang = "ar"  # Arabic
 
         processor.process_page("Test Page")
 
         # Verify language in database
-        with temp_db._get_connection() as conn:
-            record = conn.execute("SELECT language FROM pages WHERE page_title='Test Page'").fetchone()
-            assert record["language"] == "ar"
-
-    def test_process_page_with_empty_caption(self, processor, mock_wiki_api, temp_db):
-        """Test processing template with empty caption."""
-        page_text = "{{NC|test.jpg}}"
-
-        mock_wiki_api.get_page_text.return_value = page_text
-        mock_wiki_api.lang = "en"
-        processor.uploader.upload_file.return_value = {"success": True}
-
-        processor.process_page("Test Page")
+        record = temp_db.ro_cursor().execute("SELECT language FROM pages WHERE page_title='Test Page'").fetchone()
+        assert record["language"] == "ar"
 
-        # Check the saved text
-        call_args = mock_wiki_api.save_page.call_args
-        saved_text = call_args[0][1]
-
-        # Should still have file syntax, even with empty caption
-        assert "[[File:test.jpg|thumb]]" in saved_text
-
-    def test_process_page_duplicate_file_uses_existing_filename(self, processor, mock_wiki_api, temp_db):
+    def test_process_page_duplicate_file_uses_existing_filename(
+        self, processor, fake_wiki_api, fake_uploader, temp_db
+    ):
         """Test that duplicate file uses the existing file's name in page update."""
-        page_text = "Text before\n{{NC|new_file.jpg|My caption}}\nText after"
+        fake_wiki_api.page_text = "Text before\n{{NC|new_file.jpg|My caption}}\nText after"
 
-        mock_wiki_api.get_page_text.return_value = page_text
-        mock_wiki_api.lang = "en"
         # Simulate duplicate with different filename
-        processor.uploader.upload_file.return_value = {
+        fake_uploader.default = {
             "success": False,
             "error": "duplicate",
             "duplicate_of": "existing_file.jpg",
@@ -324,48 +307,96 @@ class TestPageProcessor:
         assert result is True  # Page should be updated
 
         # Check the saved text uses the duplicate filename
-        call_args = mock_wiki_api.save_page.call_args
-        saved_text = call_args[0][1]
+        saved_text = fake_wiki_api.saves[-1].text
 
         # Should use the existing (duplicate) filename
-        assert "[[File:existing_file.jpg|thumb|My caption]]" in saved_text
-        assert "{{NC|new_file.jpg|My caption}}" not in saved_text
+        assert saved_text == f"Text before\n[[File:existing_file.jpg|thumb|My caption]]\nText after\n{_CAT}"
 
         # Verify page record shows file was processed
-        with temp_db._get_connection() as conn:
-            record = conn.execute("SELECT * FROM pages WHERE page_title='Test Page'").fetchone()
-            assert record["templates_found"] == 1
-            assert record["files_uploaded"] == 1  # Counted as uploaded (using existing)
+        record = temp_db.ro_cursor().execute("SELECT * FROM pages WHERE page_title='Test Page'").fetchone()
+        assert record["templates_found"] == 1
+        assert record["files_uploaded"] == 1  # Counted as uploaded (using existing)
 
-    def test_process_page_mixed_upload_and_duplicate(self, processor, mock_wiki_api, temp_db):
+    def test_process_page_mixed_upload_and_duplicate(self, processor, fake_wiki_api, fake_uploader, temp_db):
         """Test page with both successful uploads and duplicates."""
-        page_text = """
+        fake_wiki_api.page_text = """
         {{NC|new_file.jpg|New caption}}
         {{NC|dup_file.jpg|Dup caption}}
         """
 
-        mock_wiki_api.get_page_text.return_value = page_text
-        mock_wiki_api.lang = "en"
         # First upload succeeds, second is duplicate
-        processor.uploader.upload_file.side_effect = [
-            {"success": True},
-            {"success": False, "error": "duplicate", "duplicate_of": "existing.jpg"},
-        ]
+        fake_uploader.results["dup_file.jpg"] = {
+            "success": False,
+            "error": "duplicate",
+            "duplicate_of": "existing.jpg",
+        }
 
         result = processor.process_page("Test Page")
 
         assert result is True
 
         # Check the saved text
-        call_args = mock_wiki_api.save_page.call_args
-        saved_text = call_args[0][1]
+        saved_text = fake_wiki_api.saves[-1].text
 
         # Both should be replaced with correct filenames
-        assert "[[File:new_file.jpg|thumb|New caption]]" in saved_text
-        assert "[[File:existing.jpg|thumb|Dup caption]]" in saved_text
+        present = ("[[File:new_file.jpg|thumb|New caption]]", "[[File:existing.jpg|thumb|Dup caption]]")
+        assert all(needle in saved_text for needle in present)
+        assert "{{NC|" not in saved_text
 
         # Verify both counted as uploaded
-        with temp_db._get_connection() as conn:
-            record = conn.execute("SELECT * FROM pages WHERE page_title='Test Page'").fetchone()
-            assert record["templates_found"] == 2
-            assert record["files_uploaded"] == 2
+        record = temp_db.ro_cursor().execute("SELECT * FROM pages WHERE page_title='Test Page'").fetchone()
+        assert record["templates_found"] == 2
+        assert record["files_uploaded"] == 2
+
+    def test_upload_workers_from_config(self, fake_wiki_api, fake_uploader, temp_db, sample_config):
+        """Test upload concurrency is read from processing config, with a default."""
+        configured = PageProcessor(fake_wiki_api, fake_uploader, temp_db, sample_config)
+        default = PageProcessor(fake_wiki_api, fake_uploader, temp_db, PROCESSOR_CONFIG)
+
+        assert configured.upload_workers == sample_config["processing"]["upload_workers"]
+        assert default.upload_workers == DEFAULT_UPLOAD_WORKERS
+
+    @pytest.mark.parametrize("processing", [None, {}, {"upload_workers": None}], ids=["no_section", "no_key", "empty"])
+    def test_upload_workers_default_for_empty_config(self, fake_wiki_api, fake_uploader, temp_db, processing):
+        """Test an empty processing section or upload_workers key (YAML null) falls back to the default."""
+        processor = PageProcessor(fake_wiki_api, fake_uploader, temp_db, {**PROCESSOR_CONFIG, "processing": processing})
+
+        assert processor.upload_workers == DEFAULT_UPLOAD_WORKERS
+
+    def test_process_page_multiple_upload_workers(self, fake_wiki_api, fake_uploader, temp_db):
+        """Test files are uploaded once each and counted in template order with several workers."""
+        concurrent = PageProcessor(
+            fake_wiki_api, fake_uploader, temp_db, {**PROCESSOR_CONFIG, "processing": {"upload_workers": 3}}
+        )
+        fake_wiki_api.page_text = "{{NC|a.jpg}} {{NC|b.jpg}} {{NC|a.jpg}} {{NC|c.jpg}}"
+        fake_uploader.results["b.jpg"] = {"success": False, "error": "duplicate", "duplicate_of": "old.jpg"}
+        fake_uploader.results["c.jpg"] = {"success": False, "error": "failed"}
+
+        assert concurrent.process_page("Test Page") is True
+        assert sorted(fake_uploader.calls) == ["a.jpg", "b.jpg", "c.jpg"]
+        assert fake_wiki_api.saves[-1].text == (
+            f"[[File:a.jpg|thumb]] [[File:old.jpg|thumb]] [[File:a.jpg|thumb]] {{{{NC|c.jpg}}}}\n{_CAT}"
+        )
+
+        record = temp_db.ro_cursor().execute("SELECT * FROM pages WHERE page_title='Test Page'").fetchone()
+        assert (record["templates_found"], record["files_uploaded"]) == (4, 2)
+
+
+class TestConcurrentUploads:
+    """Tests for upload workers sharing one real WikipediaAPI."""
+
+    def test_login_once_across_upload_workers(self, mock_site, temp_db):
+        """Test workers uploading at the same time log the shared client in only once."""
+        mock_site.pages.__getitem__.return_value.text.return_value = "{{NC|a.jpg}} {{NC|b.jpg}} {{NC|c.jpg}}"
+        mock_site.images.__getitem__.return_value.exists = False
+        mock_site.raw_call.return_value = SUCCESS_JSON
+        # Keep the first login in progress long enough for the other workers to reach it
+        mock_site.login.side_effect = lambda *args: threading.Event().wait(0.05)
+
+        api = WikipediaAPI("en", "user", "pass")
+        config = {**PROCESSOR_CONFIG, "processing": {"upload_workers": 3}}
+        processor = PageProcessor(api, _UrlUploader(api, workers=3), temp_db, config)
+
+        assert processor.process_page("Test Page") is True
+        mock_site.login.assert_called_once_with("user", "pass")
+        assert mock_site.raw_call.call_count == 3
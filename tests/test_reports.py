@@ -10,6 +10,18 @@ from src.database import Database
 from src.reports import Reporter
 
 
+@pytest.fixture(scope="class")
+def reports_dir(tmp_path_factory):
+    """One output directory shared by every report test in a class."""
+    return tmp_path_factory.mktemp("reports")
+
+
+@pytest.fixture
+def report_path(reports_dir, request):
+    """Report file path unique to the current test."""
+    return reports_dir / f"{request.node.name}.json"
+
+
 class TestReporter:
     """Tests for Reporter class."""
 
@@ -38,9 +50,13 @@ class TestReporter:
     def test_generate_summary_with_uploads(self, temp_db):
         """Test generating summary with upload data."""
         # Add test data
-        temp_db.record_upload("file1.jpg", "en", "success")
-        temp_db.record_upload("file2.jpg", "en", "success")
-        temp_db.record_upload("file3.jpg", "ar", "success")
+        temp_db.record_uploads_bulk(
+            [
+                ("file1.jpg", "en", "success", None),
+                ("file2.jpg", "en", "success", None),
+                ("file3.jpg", "ar", "success", None),
+            ]
+        )
         temp_db.record_page_processing("Page1", "en", 2, 2)
 
         reporter = Reporter(temp_db)
@@ -83,8 +99,7 @@ class TestReporter:
     def test_generate_summary_limits_recent_errors(self, temp_db):
         """Test that recent errors are limited to 10."""
         # Add more than 10 errors
-        for i in range(15):
-            temp_db.record_upload(f"error{i}.jpg", "en", "failed", f"Error {i}")
+        temp_db.record_uploads_bulk([(f"error{i}.jpg", "en", "failed", f"Error {i}") for i in range(15)])
 
         reporter = Reporter(temp_db)
         summary = reporter.generate_summary()
@@ -103,31 +118,30 @@ class TestReporter:
         # Only successful uploads should count
         assert summary["total"]["total_uploads"] == 1
 
-    def test_save_report_creates_file(self, temp_db, tmp_path):
+    def test_save_report_creates_file(self, temp_db, report_path):
         """Test saving report creates JSON file."""
         # Add some data
         temp_db.record_upload("file1.jpg", "en", "success")
 
         reporter = Reporter(temp_db)
-        output_path = tmp_path / "report.json"
-
-        reporter.save_report(str(output_path))
+        report = reporter.save_report(str(report_path))
 
         # Verify file was created
-        assert output_path.exists()
+        assert report_path.exists()
 
-        # Verify it's valid JSON
-        with open(output_path, "r") as f:
+        # Verify it's valid JSON holding the returned report
+        with open(report_path, "r") as f:
             data = json.load(f)
 
+        assert data == report
         assert "total" in data
         assert "by_language" in data
         assert "recent_errors" in data
 
-    def test_save_report_creates_directory(self, temp_db, tmp_path):
+    def test_save_report_creates_directory(self, temp_db, reports_dir, request):
         """Test saving report creates parent directories."""
         reporter = Reporter(temp_db)
-        output_path = tmp_path / "nested" / "reports" / "summary.json"
+        output_path = reports_dir / request.node.name / "reports" / "summary.json"
 
         reporter.save_report(str(output_path))
 
@@ -135,7 +149,7 @@ class TestReporter:
         assert output_path.parent.exists()
         assert output_path.exists()
 
-    def test_save_report_json_structure(self, temp_db, tmp_path):
+    def test_save_report_json_structure(self, temp_db, report_path):
         """Test saved report has correct JSON structure."""
         # Add varied data
         temp_db.record_upload("file1.jpg", "en", "success")
@@ -144,13 +158,8 @@ class TestReporter:
         temp_db.record_page_processing("Page1", "en", 2, 1)
 
         reporter = Reporter(temp_db)
-        output_path = tmp_path / "report.json"
-
-        reporter.save_report(str(output_path))
-
-        # Load and verify structure
-        with open(output_path, "r") as f:
-            data = json.load(f)
+        # Verify the structure of the report that was written
+        data = reporter.save_report(str(report_path))
 
         # Check total structure
         assert isinstance(data["total"], dict)
@@ -169,34 +178,34 @@ class TestReporter:
             assert "filename" in data["recent_errors"][0]
             assert "error" in data["recent_errors"][0]
 
-    def test_save_report_overwrites_existing(self, temp_db, tmp_path):
+    def test_save_report_overwrites_existing(self, temp_db, report_path):
         """Test that saving report overwrites existing file."""
-        output_path = tmp_path / "report.json"
-
         # Create initial report
         temp_db.record_upload("file1.jpg", "en", "success")
         reporter = Reporter(temp_db)
-        reporter.save_report(str(output_path))
+        reporter.save_report(str(report_path))
 
         # Add more data and save again
         temp_db.record_upload("file2.jpg", "en", "success")
-        reporter.save_report(str(output_path))
-
-        # Load and verify it has updated data
-        with open(output_path, "r") as f:
-            data = json.load(f)
+        data = reporter.save_report(str(report_path))
 
+        # Verify the file holds the updated report
         assert data["total"]["total_uploads"] == 2
+        assert json.loads(report_path.read_text(encoding="utf-8")) == data
 
     def test_generate_summary_by_language_sorted(self, temp_db):
         """Test that by_language results are sorted by upload count."""
         # Add uploads with different counts per language
-        temp_db.record_upload("file1.jpg", "en", "success")
-        temp_db.record_upload("file2.jpg", "en", "success")
-        temp_db.record_upload("file3.jpg", "en", "success")
-        temp_db.record_upload("file4.jpg", "ar", "success")
-        temp_db.record_upload("file5.jpg", "ar", "success")
-        temp_db.record_upload("file6.jpg", "fr", "success")
+        temp_db.record_uploads_bulk(
+            [
+                ("file1.jpg", "en", "success", None),
+                ("file2.jpg", "en", "success", None),
+                ("file3.jpg", "en", "success", None),
+                ("file4.jpg", "ar", "success", None),
+                ("file5.jpg", "ar", "success", None),
+                ("file6.jpg", "fr", "success", None),
+            ]
+        )
 
         reporter = Reporter(temp_db)
         summary = reporter.generate_summary()
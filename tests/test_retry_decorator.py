@@ -0,0 +1,115 @@
+"""
+Tests for retry decorator.
+"""
+
+import time
+from unittest.mock import Mock
+
+import pytest
+from src.retry_decorator import retry
+
+from .fakes import FakeClock
+
+
+@retry()
+def _probe():
+    """Docstring."""
+
+
+class TestRetryDecorator:
+    """Tests for retry decorator."""
+
+    def test_retry_success_first_attempt(self, fake_clock):
+        """Test function that succeeds on first attempt is not retried."""
+        calls = []
+
+        @retry(max_attempts=3, delay=0, backoff=1)
+        def succeed():
+            calls.append(1)
+            return "ok"
+
+        assert succeed() == "ok"
+        assert len(calls) == 1
+        assert fake_clock.sleeps == []
+
+    def test_retry_succeeds_after_failures(self, fake_clock):
+        """Test function that fails twice and then succeeds."""
+        attempts = Mock(side_effect=[ValueError("first"), ValueError("second"), "ok"], __name__="flaky")
+        flaky = retry(max_attempts=3, delay=0, backoff=1)(attempts)
+
+        assert flaky() == "ok"
+        assert attempts.call_count == 3
+        assert len(fake_clock.sleeps) == 2
+
+    def test_retry_exhausts_attempts(self, fake_clock):
+        """Test last exception is re-raised after max_attempts failures."""
+        calls = []
+
+        @retry(max_attempts=3, delay=0, backoff=1)
+        def always_fail():
+            calls.append(1)
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError, match="boom"):
+            always_fail()
+
+        assert len(calls) == 3
+
+    def test_retry_exponential_backoff(self, fake_clock):
+        """Test delays grow by the backoff multiplier between attempts."""
+        attempted_at = []
+
+        # Powers of two keep the virtual clock arithmetic exact
+        @retry(max_attempts=4, delay=0.25, backoff=2)
+        def always_fail():
+            attempted_at.append(time.time())
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError):
+            always_fail()
+
+        assert fake_clock.sleeps == [0.25, 0.5, 1.0]
+        assert [later - earlier for earlier, later in zip(attempted_at, attempted_at[1:])] == [0.25, 0.5, 1.0]
+
+    def test_retry_uses_injected_sleep_fn(self, fake_clock):
+        """Test delays go to sleep_fn instead of time.sleep when one is given."""
+        injected = FakeClock()
+
+        @retry(max_attempts=3, delay=1, backoff=3, sleep_fn=injected.sleep)
+        def always_fail():
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError):
+            always_fail()
+
+        assert injected.sleeps == [1, 3]
+        assert fake_clock.sleeps == []
+
+    def test_retry_only_listed_exceptions(self, fake_clock):
+        """Test exceptions outside ``exceptions`` propagate without retrying."""
+        calls = []
+
+        @retry(max_attempts=3, delay=0, backoff=1, exceptions=(ConnectionError,))
+        def wrong_error():
+            calls.append(1)
+            raise KeyError("not retried")
+
+        with pytest.raises(KeyError):
+            wrong_error()
+
+        assert len(calls) == 1
+        assert fake_clock.sleeps == []
+
+    def test_retry_passes_arguments(self):
+        """Test positional and keyword arguments reach the wrapped function."""
+
+        @retry(max_attempts=2, delay=0, backoff=1)
+        def add(a, b, scale=1):
+            return (a + b) * scale
+
+        assert add(1, 2, scale=3) == 9
+
+    def test_retry_preserves_function_metadata(self):
+        """Test functools.wraps keeps the wrapped function's name and docstring."""
+        assert _probe.__name__ == "_probe"
+        assert _probe.__doc__ == "Docstring."
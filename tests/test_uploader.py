@@ -2,20 +2,60 @@
 Tests for file uploader module.
 """
 
-from unittest.mock import Mock, patch
+import urllib.request
+from types import SimpleNamespace
+from unittest.mock import Mock, call
 
 import pytest
+from src import uploader as uploader_module
 from src.uploader import FileUploader
 
+from .fakes import StubNcApi, StubWikiApi
+
+
+@pytest.fixture(scope="module")
+def uploader(_shared_db, sample_config):
+    """Create one FileUploader shared by every test in this module."""
+    return FileUploader(StubNcApi(), StubWikiApi(), _shared_db, sample_config)
+
+
+@pytest.fixture(autouse=True)
+def _reset(uploader, temp_db):
+    """Restore the shared uploader's API stubs after each test (temp_db empties the database)."""
+    yield
+    uploader.nc_api.reset()
+    uploader.wiki_api.reset()
+
+
+@pytest.fixture
+def mock_nc_api(uploader):
+    """NC Commons API stub wired into the shared uploader."""
+    return uploader.nc_api
+
+
+@pytest.fixture
+def mock_wiki_api(uploader):
+    """Wikipedia API stub wired into the shared uploader."""
+    return uploader.wiki_api
+
+
+@pytest.fixture
+def download_mocks(monkeypatch):
+    """Replace the download step of the file-upload fallback (urlretrieve and the temp file)."""
+    temp_file = Mock()
+    temp_file.__enter__ = Mock(return_value="/tmp/test123.tmp")
+    temp_file.__exit__ = Mock(return_value=None)
+    retrieve = Mock()
+
+    monkeypatch.setattr(urllib.request, "urlretrieve", retrieve)
+    monkeypatch.setattr(uploader_module, "TemporaryDownloadFile", Mock(return_value=temp_file))
+
+    return SimpleNamespace(retrieve=retrieve, temp_file=temp_file)
+
 
 class TestFileUploader:
     """Tests for FileUploader class."""
 
-    @pytest.fixture
-    def uploader(self, mock_nc_api, mock_wiki_api, temp_db, sample_config):
-        """Create FileUploader instance for testing."""
-        return FileUploader(mock_nc_api, mock_wiki_api, temp_db, sample_config)
-
     def test_uploader_initialization(self, mock_nc_api, mock_wiki_api, temp_db, sample_config):
         """Test uploader initializes correctly."""
         uploader = FileUploader(mock_nc_api, mock_wiki_api, temp_db, sample_config)
@@ -49,8 +89,8 @@ class TestFileUploader:
         assert result == {"success": True}
 
         # Verify NC Commons was queried
-        mock_nc_api.get_image_url.assert_called_once_with("test.jpg")
-        mock_nc_api.get_file_description.assert_called_once_with("test.jpg")
+        assert mock_nc_api.get_image_url.calls == [call("test.jpg")]
+        assert mock_nc_api.get_file_description.calls == [call("test.jpg")]
 
         # Verify upload was attempted
         mock_wiki_api.upload_from_url.assert_called_once()
@@ -70,20 +110,12 @@ class TestFileUploader:
         assert result == {"success": False, "error": "exists"}
 
         # Should be recorded as exists
-        with temp_db._get_connection() as conn:
-            record = conn.execute("SELECT error FROM uploads WHERE filename='dup.jpg'").fetchone()
-            assert record["error"] == "exists"
+        record = temp_db.recorded_uploads[-1]
+        assert record["filename"] == "dup.jpg"
+        assert record["error"] == "exists"
 
-    @patch("urllib.request.urlretrieve")
-    @patch("src.uploader.TemporaryDownloadFile")
-    def test_upload_via_download_success(self, mock_temp_class, mock_retrieve, uploader, mock_wiki_api, temp_db):
+    def test_upload_via_download_success(self, download_mocks, uploader, mock_wiki_api, temp_db):
         """Test successful upload via download method."""
-        # Setup temp file mock with context manager support
-        mock_temp = Mock()
-        mock_temp.__enter__ = Mock(return_value="/tmp/test123.tmp")
-        mock_temp.__exit__ = Mock(return_value=None)
-        mock_temp_class.return_value = mock_temp
-
         mock_wiki_api.upload_from_file.return_value = {"success": True}
 
         result = uploader._upload_via_download(
@@ -93,23 +125,16 @@ class TestFileUploader:
         assert result == {"success": True}
 
         # Verify file was downloaded
-        mock_retrieve.assert_called_once_with("https://example.com/test.jpg", "/tmp/test123.tmp")
+        assert download_mocks.retrieve.call_args_list == [call("https://example.com/test.jpg", "/tmp/test123.tmp")]
 
         # Verify upload was attempted
         mock_wiki_api.upload_from_file.assert_called_once()
 
         # Verify cleanup was called (via __exit__)
-        mock_temp.__exit__.assert_called_once()
+        download_mocks.temp_file.__exit__.assert_called_once()
 
-    @patch("urllib.request.urlretrieve")
-    @patch("src.uploader.TemporaryDownloadFile")
-    def test_upload_via_download_exists(self, mock_temp_class, mock_retrieve, uploader, mock_wiki_api, temp_db):
+    def test_upload_via_download_exists(self, download_mocks, uploader, mock_wiki_api, temp_db):
         """Test upload via download with exists file."""
-        mock_temp = Mock()
-        mock_temp.__enter__ = Mock(return_value="/tmp/test123.tmp")
-        mock_temp.__exit__ = Mock(return_value=None)
-        mock_temp_class.return_value = mock_temp
-
         mock_wiki_api.upload_from_file.return_value = {"success": False, "error": "exists"}
 
         result = uploader._upload_via_download("dup.jpg", "https://example.com/dup.jpg", "Description", "Comment", "en")
@@ -117,24 +142,17 @@ class TestFileUploader:
         assert result == {"success": False, "error": "exists"}
 
         # Still should clean up temp file
-        mock_temp.__exit__.assert_called_once()
+        download_mocks.temp_file.__exit__.assert_called_once()
 
-    @patch("urllib.request.urlretrieve")
-    @patch("src.uploader.TemporaryDownloadFile")
-    def test_upload_via_download_cleanup_on_error(self, mock_temp_class, mock_retrieve, uploader, mock_wiki_api):
+    def test_upload_via_download_cleanup_on_error(self, download_mocks, uploader, mock_wiki_api):
         """Test temp file cleanup on error."""
-        mock_temp = Mock()
-        mock_temp.__enter__ = Mock(return_value="/tmp/test123.tmp")
-        mock_temp.__exit__ = Mock(return_value=None)
-        mock_temp_class.return_value = mock_temp
-
-        mock_retrieve.side_effect = Exception("Download failed")
+        download_mocks.retrieve.side_effect = Exception("Download failed")
 
         with pytest.raises(Exception, match="Download failed"):
             uploader._upload_via_download("test.jpg", "https://example.com/test.jpg", "Description", "Comment", "en")
 
         # Should still clean up temp file
-        mock_temp.__exit__.assert_called_once()
+        download_mocks.temp_file.__exit__.assert_called_once()
 
     def test_process_description_removes_categories(self, uploader, sample_config):
         """Test description processing removes categories."""
@@ -214,7 +232,7 @@ class TestFileUploader:
         assert not temp_db.is_file_uploaded("test.jpg", "en")
 
     def test_upload_via_download_copyupload_error_triggers_fallback(
-        self, uploader, mock_nc_api, mock_wiki_api, temp_db
+        self, download_mocks, uploader, mock_nc_api, mock_wiki_api, temp_db
     ):
         """Test that copyupload error triggers fallback to file download."""
         mock_nc_api.get_image_url.return_value = "https://example.com/test.jpg"
@@ -223,9 +241,7 @@ class TestFileUploader:
         mock_wiki_api.upload_from_file.return_value = {"success": True}
         mock_wiki_api.lang = "en"
 
-        with patch("urllib.request.urlretrieve"):
-            with patch("pathlib.Path.unlink"):
-                result = uploader.upload_file("test.jpg")
+        result = uploader.upload_file("test.jpg")
 
         assert result == {"success": True}
         mock_wiki_api.upload_from_file.assert_called_once()
@@ -239,9 +255,7 @@ class TestFileUploader:
         mock_wiki_api.upload_from_file.return_value = {"success": True}
         mock_wiki_api.lang = "en"
 
-        with patch("urllib.request.urlretrieve") as _mock_retrieve:
-            with patch("pathlib.Path.unlink"):
-                result = uploader.upload_file("file.jpg")
+        result = uploader.upload_file("file.jpg")
 
         assert result is True
 
@@ -264,20 +278,13 @@ class TestFileUploader:
         assert result == {"success": False, "error": "duplicate", "duplicate_of": "existing.jpg"}
 
         # Should be recorded as duplicate
-        with temp_db._get_connection() as conn:
-            record = conn.execute("SELECT status, error FROM uploads WHERE filename='dup.jpg'").fetchone()
-            assert record["status"] == "duplicate"
-            assert "existing.jpg" in record["error"]
-
-    @patch("urllib.request.urlretrieve")
-    @patch("src.uploader.TemporaryDownloadFile")
-    def test_upload_via_download_duplicate(self, mock_temp_class, mock_retrieve, uploader, mock_wiki_api, temp_db):
-        """Test upload via download with duplicate file."""
-        mock_temp = Mock()
-        mock_temp.__enter__ = Mock(return_value="/tmp/test123.tmp")
-        mock_temp.__exit__ = Mock(return_value=None)
-        mock_temp_class.return_value = mock_temp
+        record = temp_db.recorded_uploads[-1]
+        assert record["filename"] == "dup.jpg"
+        assert record["status"] == "duplicate"
+        assert "existing.jpg" in record["error"]
 
+    def test_upload_via_download_duplicate(self, download_mocks, uploader, mock_wiki_api, temp_db):
+        """Test upload via download with duplicate file."""
         mock_wiki_api.upload_from_file.return_value = {
             "success": False,
             "error": "duplicate",
@@ -289,10 +296,10 @@ class TestFileUploader:
         assert result == {"success": False, "error": "duplicate", "duplicate_of": "other.jpg"}
 
         # Should be recorded as duplicate
-        with temp_db._get_connection() as conn:
-            record = conn.execute("SELECT status, error FROM uploads WHERE filename='dup.jpg'").fetchone()
-            assert record["status"] == "duplicate"
-            assert "other.jpg" in record["error"]
+        record = temp_db.recorded_uploads[-1]
+        assert record["filename"] == "dup.jpg"
+        assert record["status"] == "duplicate"
+        assert "other.jpg" in record["error"]
 
         # Still should clean up temp file
-        mock_temp.__exit__.assert_called_once()
+        download_mocks.temp_file.__exit__.assert_called_once()
@@ -0,0 +1,3 @@
+"""
+Tests for wiki API package.
+"""
@@ -0,0 +1,72 @@
+"""
+Pytest fixtures for wiki API tests.
+
+Provides a patched mwclient Site shared by the tests of a module.
+"""
+
+from unittest.mock import MagicMock, Mock, create_autospec
+
+import pytest
+from mwclient import Site
+from src.wiki_api import WikipediaAPI, main_api
+
+
+@pytest.fixture(scope="module")
+def mock_site_class():
+    """
+    Replace the Site class used by WikiAPI once per test module.
+
+    A plain attribute swap, restored at teardown; nothing else about Site
+    needs patch()'s bookkeeping.
+
+    Module scope (rather than session) keeps the real Site available to the
+    network tests, which would otherwise run with the patch still active.
+    """
+    site_class = Mock(name="Site")
+    original, main_api.Site = main_api.Site, site_class
+    yield site_class
+    main_api.Site = original
+
+
+@pytest.fixture(scope="module")
+def _site_spec():
+    """
+    Site instance mock checked against mwclient's API, built once per module.
+
+    create_autospec is slow, so one template is built per module and reset
+    for each test rather than rebuilt. The pages and images listings are
+    set by Site.__init__, so they are not part of the class spec and are
+    attached here.
+    """
+    site = create_autospec(Site, instance=True)
+    site.pages = MagicMock()
+    site.images = MagicMock()
+    return site
+
+
+@pytest.fixture
+def mock_site(mock_site_class, _site_spec):
+    """Mock Site instance returned by the patched Site class, reset for each test."""
+    _site_spec.reset_mock(return_value=True, side_effect=True)
+    # Plain attributes are not touched by reset_mock
+    _site_spec.logged_in = True
+    _site_spec.host = "test.wikipedia.org"
+    _site_spec.username = "testuser"
+
+    mock_site_class.reset_mock(return_value=True, side_effect=True)
+    mock_site_class.return_value = _site_spec
+    return _site_spec
+
+
+@pytest.fixture(scope="class")
+def en_api(mock_site_class, _site_spec):
+    """
+    One English WikipediaAPI per test class, bound to the shared mock Site.
+
+    The Site mock is reset for every test by mock_site, so tests that take
+    both fixtures configure the site the API is already using. Login state
+    is kept between tests of the class.
+    """
+    mock_site_class.reset_mock(return_value=True, side_effect=True)
+    mock_site_class.return_value = _site_spec
+    return WikipediaAPI("en", "user", "pass")
@@ -7,34 +7,33 @@ self.site.pages and self.site.images, with and without 'File:' prefix.
 import pytest
 from src.wiki_api import WikiAPI
 
+pytestmark = pytest.mark.network
 
-@pytest.mark.network
-def test_pages_access_with_file_prefix():
-    """Test accessing file via site.pages with File: prefix."""
-    api = WikiAPI("commons.wikimedia.org")
+FILENAME = "Cardiovascular-disease-death-rates,_1980_to_2021,_DEU.svg"
 
-    # Access with File: prefix
-    page = api.site.pages["File:Cardiovascular-disease-death-rates,_1980_to_2021,_DEU.svg"]
 
-    assert page.exists is True
+@pytest.fixture(scope="module")
+def commons_api():
+    """One anonymous commons.wikimedia.org connection shared by every case."""
+    return WikiAPI("commons.wikimedia.org")
 
-    # Access without File: prefix
-    page2 = api.site.pages["Cardiovascular-disease-death-rates,_1980_to_2021,_DEU.svg"]
 
-    assert page2.exists is False
+@pytest.mark.parametrize(
+    ("access", "title", "exists"),
+    [
+        pytest.param("pages", f"File:{FILENAME}", True, id="pages_with_prefix"),
+        pytest.param("pages", FILENAME, False, id="pages_without_prefix"),
+        pytest.param("images", f"File:{FILENAME}", False, id="images_with_prefix"),
+        pytest.param("images", FILENAME, True, id="images_without_prefix"),
+    ],
+)
+def test_file_access(commons_api, access, title, exists):
+    """Test site.pages needs the File: prefix and site.images must not have it."""
+    page = getattr(commons_api.site, access)[title]
 
+    assert page.exists is exists
 
-@pytest.mark.network
-def test_images_access_with_file_prefix():
-    """Test accessing file via site.images with File: prefix."""
-    api = WikiAPI("commons.wikimedia.org")
 
-    # Access with File: prefix
-    page = api.site.images["File:Cardiovascular-disease-death-rates,_1980_to_2021,_DEU.svg"]
-
-    assert page.exists is False
-
-    # Access without File: prefix
-    page2 = api.site.images["Cardiovascular-disease-death-rates,_1980_to_2021,_DEU.svg"]
-
-    assert page2.exists is True
+def test_exists_batch(commons_api):
+    """Test one batched query reports the same existence as site.pages."""
+    assert commons_api.exists_batch([f"File:{FILENAME}", FILENAME]) == {f"File:{FILENAME}": True, FILENAME: False}
@@ -2,21 +2,66 @@
 Tests for wiki API module.
 """
 
-from unittest.mock import MagicMock, Mock, patch
+import copy
+import threading
+from types import SimpleNamespace
+from unittest.mock import Mock
 
 import pytest
+from mwclient.errors import LoginError
 from src.wiki_api import WikiAPI
 
 
+@pytest.fixture(scope="module")
+def api_factory(mock_site_class, _site_spec):
+    """
+    Return a function making copies of one prebuilt, not yet logged-in WikiAPI.
+
+    Keyword arguments override attributes on the copy. Copies share the
+    module's mock Site, which mock_site resets for every test; tests that
+    exercise __init__ itself construct WikiAPI directly.
+    """
+    # A test run earlier on this worker may have left a side_effect on Site
+    mock_site_class.reset_mock(return_value=True, side_effect=True)
+    mock_site_class.return_value = _site_spec
+    prototype = WikiAPI("test.wikipedia.org", username="testuser", password="testpass")
+
+    def make(**attrs):
+        api = copy.copy(prototype)
+        vars(api).update(attrs)
+        return api
+
+    return make
+
+
+@pytest.fixture
+def page(mock_site):
+    """Mock page returned for every site.pages lookup."""
+    page = Mock()
+    mock_site.pages.__getitem__.return_value = page
+    return page
+
+
+@pytest.fixture
+def logged_in_api(api_factory, mock_site):
+    """WikiAPI that has completed ensure_logged_in()."""
+    api = api_factory()
+    api.ensure_logged_in()
+    return api
+
+
+@pytest.fixture
+def unlogged_api(api_factory, mock_site):
+    """WikiAPI whose login attempts leave the site logged out."""
+    mock_site.logged_in = False
+    return api_factory()
+
+
 class TestWikiAPI:
     """Tests for WikiAPI base class."""
 
-    @patch("src.wiki_api.main_api.Site")
-    def test_wiki_api_initialization(self, mock_site_class):
+    def test_wiki_api_initialization(self, mock_site_class, mock_site):
         """Test WikiAPI initializes connection."""
-        mock_site = Mock()
-        mock_site_class.return_value = mock_site
-
         api = WikiAPI("test.wikipedia.org", username="testuser", password="testpass")
 
         mock_site_class.assert_called_once_with(
@@ -26,132 +71,138 @@ class TestWikiAPI:
         )
         assert api.site == mock_site
 
-    @patch("src.wiki_api.main_api.Site")
-    def test_wiki_api_connection_error(self, mock_site_class):
+    def test_wiki_api_connection_error(self, mock_site_class, mock_site):
         """Test WikiAPI raises connection errors."""
         mock_site_class.side_effect = ConnectionError("Failed to connect")
 
         with pytest.raises(ConnectionError, match="Failed to connect"):
             WikiAPI("test.wikipedia.org", username="testuser", password="testpass")
 
-    @patch("src.wiki_api.main_api.Site")
-    def test_wiki_api_with_credentials(self, mock_site_class):
-        """Test WikiAPI initialization with username and password."""
-        mock_site = Mock()
-        mock_site_class.return_value = mock_site
-
-        api = WikiAPI("test.wikipedia.org", username="testuser", password="testpass")
-
-        assert api.username == "testuser"
-        assert api.password == "testpass"
+    @pytest.mark.parametrize(
+        ("username", "password"),
+        [
+            pytest.param("testuser", "testpass", id="both"),
+            pytest.param(None, None, id="neither"),
+            pytest.param("testuser", None, id="only_username"),
+            pytest.param(None, "testpass", id="only_password"),
+        ],
+    )
+    def test_wiki_api_credentials(self, mock_site, username, password):
+        """Test credentials are stored as given and login is always deferred."""
+        api = WikiAPI("test.wikipedia.org", username=username, password=password)
+
+        assert api.username == username
+        assert api.password == password
         assert api.login_done is False
 
-    @patch("src.wiki_api.main_api.Site")
-    def test_wiki_api_without_credentials(self, mock_site_class):
-        """Test WikiAPI initialization without credentials skips login setup."""
-        mock_site = Mock()
-        mock_site_class.return_value = mock_site
-
-        api = WikiAPI("test.wikipedia.org")
-
-        # Verify UploadHandler is NOT initialized (no credentials)
-        assert not hasattr(api, "login_done") or api.login_done is False
-
-    @patch("src.wiki_api.main_api.Site")
-    def test_wiki_api_only_username(self, mock_site_class):
-        """Test WikiAPI with only username warns about missing password."""
-        mock_site = Mock()
-        mock_site_class.return_value = mock_site
-
-        api = WikiAPI("test.wikipedia.org", username="testuser", password=None)
+    def test_ensure_logged_in_success(self, logged_in_api, mock_site):
+        """Test successful login."""
+        mock_site.login.assert_called_once_with("testuser", "testpass")
+        assert logged_in_api.login_done is True
 
-        assert api.username == "testuser"
-        assert api.password is None
+    def test_ensure_logged_in_failure(self, api_factory, mock_site):
+        """Test a rejected login is logged and leaves the API logged out."""
+        mock_site.login.side_effect = LoginError(mock_site, "Failed", "Incorrect username or password")
+        api = api_factory()
 
-    @patch("src.wiki_api.main_api.Site")
-    def test_wiki_api_only_password(self, mock_site_class):
-        """Test WikiAPI with only password warns about missing username."""
-        mock_site = Mock()
-        mock_site_class.return_value = mock_site
+        api.ensure_logged_in()
 
-        api = WikiAPI("test.wikipedia.org", username=None, password="testpass")
+        mock_site.login.assert_called_once_with("testuser", "testpass")
+        assert api.login_done is False
 
-        assert api.username is None
-        assert api.password == "testpass"
+    def test_ensure_logged_in_concurrent_calls_log_in_once(self, api_factory, mock_site):
+        """Test threads calling ensure_logged_in together share a single login."""
+        # Keep the first login in progress long enough for the other threads to reach the lock
+        mock_site.login.side_effect = lambda *args: threading.Event().wait(0.05)
+        api = api_factory()
+        started = threading.Barrier(4)
 
-    @patch("src.wiki_api.main_api.Site")
-    def test_ensure_logged_in_success(self, mock_site_class):
-        """Test successful login."""
-        mock_site = Mock()
-        mock_site.logged_in = True
-        mock_site_class.return_value = mock_site
+        def login():
+            started.wait(timeout=5)
+            api.ensure_logged_in()
 
-        api = WikiAPI("test.wikipedia.org", username="testuser", password="testpass")
-        api.ensure_logged_in()
+        threads = [threading.Thread(target=login) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=5)
 
         mock_site.login.assert_called_once_with("testuser", "testpass")
         assert api.login_done is True
+        assert not api._login_lock.locked()
 
-    @pytest.mark.skip(reason="mwclient.errors.LoginError is difficult to instantiate properly")
-    def test_ensure_logged_in_failure(self):
-        """Test login failure handling - skipped due to LoginError complexity."""
-        pass  # noqa: PIE790
-
-    @patch("src.wiki_api.main_api.Site")
-    def test_save_page_not_logged_in(self, mock_site_class):
-        """Test save_page when not logged in returns False."""
-        mock_page = Mock()
-        mock_page.save.return_value = False
-        mock_site = MagicMock()
-        mock_site.pages.__getitem__.return_value = mock_page
-        mock_site_class.return_value = mock_site
-
-        api = WikiAPI("test.wikipedia.org", username="testuser", password="testpass")
-        # Don't call ensure_logged_in, so login_done remains False
-        result = api.save_page("Test Page", "New content", "Edit summary")
+    def test_save_page_not_logged_in(self, unlogged_api, page):
+        """Test save_page returns False without saving when login does not succeed."""
+        result = unlogged_api.save_page("Test Page", "New content", "Edit summary")
 
         assert result is False
+        page.save.assert_not_called()
 
-    @patch("src.wiki_api.main_api.Site")
-    def test_save_page_after_login(self, mock_site_class):
+    def test_save_page_after_login(self, logged_in_api, page):
         """Test save_page after successful login."""
-        mock_page = Mock()
-        mock_site = MagicMock()
-        mock_site.pages.__getitem__.return_value = mock_page
-        mock_site_class.return_value = mock_site
-
-        api = WikiAPI("test.wikipedia.org", username="testuser", password="testpass")
-        api.ensure_logged_in()
-        result = api.save_page("Test Page", "New content", "Edit summary")
+        result = logged_in_api.save_page("Test Page", "New content", "Edit summary")
 
-        mock_page.save.assert_called_once_with("New content", summary="Edit summary")
-        assert result == mock_page.save.return_value
+        page.save.assert_called_once_with("New content", summary="Edit summary")
+        assert result == page.save.return_value
 
-    @patch("src.wiki_api.main_api.Site")
-    def test_get_page_text(self, mock_site_class):
+    def test_get_page_text(self, api_factory, mock_site):
         """Test getting page text."""
-        mock_page = Mock()
-        mock_page.text.return_value = "Page content"
+        mock_page = SimpleNamespace(text=lambda: "Page content")
 
-        mock_site = MagicMock()
         mock_site.pages.__getitem__.return_value = mock_page
-        mock_site_class.return_value = mock_site
 
-        api = WikiAPI("test.wikipedia.org", username="testuser", password="testpass")
+        api = api_factory()
         text = api.get_page_text("Test Page")
 
         assert text == "Page content"
         mock_site.pages.__getitem__.assert_called_once_with("Test Page")
 
-    @patch("src.wiki_api.main_api.Site")
-    def test_save_page(self, mock_site_class):
+    def test_save_page(self, api_factory, page):
         """Test saving page."""
-        mock_page = Mock()
-        mock_site = MagicMock()
-        mock_site.pages.__getitem__.return_value = mock_page
-        mock_site_class.return_value = mock_site
-
-        api = WikiAPI("test.wikipedia.org", username="testuser", password="testpass")
+        api = api_factory()
         api.save_page("Test Page", "New content", "Edit summary")
 
-        mock_page.save.assert_called_once_with("New content", summary="Edit summary")
+        page.save.assert_called_once_with("New content", summary="Edit summary")
+
+    def test_exists_batch(self, api_factory, mock_site):
+        """Test page existence is read from one query, keyed by the requested titles."""
+        mock_site.api.return_value = {
+            "query": {
+                "normalized": [{"from": "File:A_b.jpg", "to": "File:A b.jpg"}],
+                "pages": {
+                    "12": {"ns": 6, "title": "File:A b.jpg"},
+                    "-1": {"ns": 0, "title": "Missing", "missing": ""},
+                },
+            }
+        }
+
+        api = api_factory()
+        result = api.exists_batch(["File:A_b.jpg", "Missing"])
+
+        assert result == {"File:A_b.jpg": True, "Missing": False}
+        mock_site.api.assert_called_once_with("query", prop="info", titles="File:A_b.jpg|Missing")
+
+    def test_exists_batch_titles_normalizing_to_same_page(self, api_factory, mock_site):
+        """Test every requested spelling of one page reports that page's existence."""
+        mock_site.api.return_value = {
+            "query": {
+                "normalized": [{"from": "File:A_b.jpg", "to": "File:A b.jpg"}],
+                "pages": {"12": {"ns": 6, "title": "File:A b.jpg"}},
+            }
+        }
+
+        api = api_factory()
+        result = api.exists_batch(["File:A_b.jpg", "File:A b.jpg"])
+
+        assert result == {"File:A_b.jpg": True, "File:A b.jpg": True}
+
+    def test_exists_batch_splits_requests(self, api_factory, mock_site):
+        """Test titles are sent in batches of at most 50."""
+        mock_site.api.return_value = {"query": {"pages": {}}}
+        titles = [f"Page {i}" for i in range(120)]
+
+        api = api_factory()
+        result = api.exists_batch(titles)
+
+        assert [len(c.kwargs["titles"].split("|")) for c in mock_site.api.call_args_list] == [50, 50, 20]
+        assert result == dict.fromkeys(titles, False)
@@ -2,59 +2,50 @@
 Tests for wiki API module.
 """
 
-from unittest.mock import MagicMock, Mock, patch
+from io import BytesIO
+from types import SimpleNamespace
+from unittest.mock import Mock
 
-from src.wiki_api import WikipediaAPI
+import pytest
+from src.wiki_api import WikipediaAPI, wikipedia_api
+
+from ..fakes import DUP_JSON, SUCCESS_JSON
+
+USER_AGENT = "NC Commons Import Bot/1.0 (https://github.com/NCCommons)"
+
+
+@pytest.fixture
+def opened_files(monkeypatch):
+    """Serve upload_from_file's open() from memory; records each (path, mode) opened."""
+    opened = []
+
+    def fake_open(path, mode="r"):
+        opened.append((path, mode))
+        return BytesIO(b"image data")
+
+    monkeypatch.setattr(wikipedia_api, "open", fake_open, raising=False)
+    return opened
 
 
 class TestWikipediaAPI:
     """Tests for WikipediaAPI class."""
 
-    @patch("src.wiki_api.main_api.Site")
-    def test_wikipedia_api_initialization(self, mock_site_class):
-        """Test WikipediaAPI initializes with correct site."""
-        mock_site = Mock()
-        mock_site_class.return_value = mock_site
+    @pytest.mark.parametrize(("lang", "host"), [("en", "en.wikipedia.org"), ("ar", "ar.wikipedia.org")])
+    def test_wikipedia_api_initialization(self, mock_site_class, mock_site, lang, host):
+        """Test WikipediaAPI connects to the Wikipedia of its language code."""
+        api = WikipediaAPI(lang, "user", "pass")
 
-        api = WikipediaAPI("en", "user", "pass")
+        mock_site_class.assert_called_once_with(host, clients_useragent=USER_AGENT, force_login=True)
+        assert (api.lang, api.site) == (lang, mock_site)
 
-        mock_site_class.assert_called_once_with(
-            "en.wikipedia.org",
-            clients_useragent="NC Commons Import Bot/1.0 (https://github.com/NCCommons)",
-            force_login=True,
-        )
-        assert api.lang == "en"
-
-    @patch("src.wiki_api.main_api.Site")
-    def test_wikipedia_api_different_language(self, mock_site_class):
-        """Test WikipediaAPI with different language code."""
-        mock_site = Mock()
-        mock_site_class.return_value = mock_site
-
-        api = WikipediaAPI("ar", "user", "pass")
-
-        mock_site_class.assert_called_once_with(
-            "ar.wikipedia.org",
-            clients_useragent="NC Commons Import Bot/1.0 (https://github.com/NCCommons)",
-            force_login=True,
-        )
-        assert api.lang == "ar"
-
-    @patch("src.wiki_api.main_api.Site")
-    def test_get_pages_with_template(self, mock_site_class):
+    def test_get_pages_with_template(self, mock_site):
         """Test getting pages that use a template."""
-        # Create mock pages
-        mock_page1 = Mock()
-        mock_page1.name = "Page 1"
-        mock_page2 = Mock()
-        mock_page2.name = "Page 2"
-
+        # Only .name is read from listed pages
+        listed = [SimpleNamespace(name="Page 1"), SimpleNamespace(name="Page 2")]
         mock_template = Mock()
-        mock_template.embeddedin.return_value = [mock_page1, mock_page2]
+        mock_template.embeddedin.return_value = listed
 
-        mock_site = MagicMock()
         mock_site.pages.__getitem__.return_value = mock_template
-        mock_site_class.return_value = mock_site
 
         api = WikipediaAPI("en", "user", "pass")
         pages = api.get_pages_with_template("NC")
@@ -62,18 +53,48 @@ class TestWikipediaAPI:
         assert pages == ["Page 1", "Page 2"]
         mock_site.pages.__getitem__.assert_called_once_with("Template:NC")
 
-    @patch("src.wiki_api.main_api.Site")
-    def test_get_pages_with_template_adds_prefix(self, mock_site_class):
+    def test_get_pages_with_template_adds_prefix(self, mock_site):
         """Test that Template: prefix is added if missing."""
         mock_template = Mock()
         mock_template.embeddedin.return_value = []
 
-        mock_site = MagicMock()
         mock_site.pages.__getitem__.return_value = mock_template
-        mock_site_class.return_value = mock_site
 
         api = WikipediaAPI("en", "user", "pass")
         api.get_pages_with_template("Template:NC")
 
         # Should not add duplicate prefix
         mock_site.pages.__getitem__.assert_called_once_with("Template:NC")
+
+    def test_upload_from_url_success(self, en_api, mock_site):
+        """Test successful upload from URL."""
+        mock_site.raw_call.return_value = SUCCESS_JSON
+
+        result = en_api.upload_from_url("test.jpg", "https://example.com/test.jpg", "Description", "Upload comment")
+
+        assert result.get("success") is True
+
+    def test_upload_from_url_duplicate(self, en_api, mock_site):
+        """Test upload from URL with duplicate file."""
+        mock_site.raw_call.return_value = DUP_JSON
+
+        result = en_api.upload_from_url("test.jpg", "https://example.com/test.jpg", "Description", "Comment")
+
+        assert result.get("success") is False
+
+    def test_upload_from_file_success(self, en_api, mock_site, opened_files):
+        """Test successful upload from file."""
+        mock_site.raw_call.return_value = SUCCESS_JSON
+
+        result = en_api.upload_from_file("test.jpg", "/tmp/test.jpg", "Description", "Comment")
+
+        assert result.get("success") is True
+        assert opened_files == [("/tmp/test.jpg", "rb")]
+
+    def test_upload_from_file_duplicate(self, en_api, mock_site, opened_files):
+        """Test upload from file with duplicate."""
+        mock_site.raw_call.return_value = DUP_JSON
+
+        result = en_api.upload_from_file("test.jpg", "/tmp/test.jpg", "Description", "Comment")
+
+        assert result.get("success") is False